@@ -96,8 +96,13 @@ def download_matches_with_boxscores(
     include_advanced: bool = False,
     max_workers: int = 5,
     verbose: bool = True,
-) -> None:
-    """Download all matches for a season, optionally including advanced box scores."""
+) -> Optional[Dict[str, Any]]:
+    """
+    Download all matches for a season, optionally including advanced box scores.
+
+    Returns the same dictionary that is written to output_file, or None if
+    the season has no matches.
+    """
 
     if verbose:
         print(f"Fetching matches for season {season_id}, category {category_id}...")
@@ -108,7 +113,7 @@ def download_matches_with_boxscores(
 
     if not matches:
         print("No matches found.")
-        return
+        return None
 
     total_matches = len(matches)
     if verbose:
@@ -264,6 +269,8 @@ def download_matches_with_boxscores(
                         print(f"    • {err_type}: {count}")
         print(f"{'=' * 60}")
 
+    return result
+
 
 def download_league_all_seasons(
     category_id: str,
@@ -0,0 +1,68 @@
+"""In-process TTL cache for Basket.fi API calls made from the TUI.
+
+Navigating into a match or team screen and back re-issues identical HTTP
+requests; keying the parsed responses on endpoint + parameters makes the
+second and later opens a memory hit instead of a network round trip.
+"""
+
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, cast
+
+from .basketfi_api import BasketFiAPI
+
+_CACHE_TTL_SECONDS = 300.0
+_CACHE: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+
+
+def _cached(key: Tuple[Any, ...], fetch: Callable[[], Any]) -> Any:
+    """Return the cached value for key, fetching and storing it on a miss."""
+    cached = _CACHE.get(key)
+    if cached is not None and time.time() - cached[0] < _CACHE_TTL_SECONDS:
+        return cached[1]
+    value = fetch()
+    _CACHE[key] = (time.time(), value)
+    return value
+
+
+def cached_get_match(match_id: str) -> Dict[str, Any]:
+    """TTL-cached BasketFiAPI.get_match."""
+    return cast(
+        Dict[str, Any],
+        _cached(("getMatch", match_id), lambda: BasketFiAPI.get_match(match_id)),
+    )
+
+
+def cached_get_team(team_id: str) -> Dict[str, Any]:
+    """TTL-cached BasketFiAPI.get_team."""
+    return cast(
+        Dict[str, Any],
+        _cached(("getTeam", team_id), lambda: BasketFiAPI.get_team(team_id)),
+    )
+
+
+def invalidate_matches(
+    competition_id: Optional[str] = None,
+    category_id: Optional[str] = None,
+    team_id: Optional[str] = None,
+) -> None:
+    """Drop a cached getMatches entry so the next call hits the network."""
+    _CACHE.pop(("getMatches", competition_id, category_id, team_id), None)
+
+
+def cached_get_matches(
+    competition_id: Optional[str] = None,
+    category_id: Optional[str] = None,
+    team_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """TTL-cached BasketFiAPI.get_matches."""
+    return cast(
+        Dict[str, Any],
+        _cached(
+            ("getMatches", competition_id, category_id, team_id),
+            lambda: BasketFiAPI.get_matches(
+                competition_id=competition_id,
+                category_id=category_id,
+                team_id=team_id,
+            ),
+        ),
+    )
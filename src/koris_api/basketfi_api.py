@@ -4,6 +4,18 @@ import requests
 from typing import Dict, Any, Optional, cast
 import time
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+
+def _parse_json(response: requests.Response) -> Dict[str, Any]:
+    """Decode a JSON response body, preferring orjson's C parser."""
+    if orjson is not None and isinstance(response.content, (bytes, bytearray)):
+        return cast(Dict[str, Any], orjson.loads(response.content))
+    return cast(Dict[str, Any], response.json())
+
 
 class BasketFiAPI:
     """Client for interacting with the Basket.fi/Torneopal API."""
@@ -22,6 +34,14 @@ class BasketFiAPI:
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.6 Safari/605.1.15",
     }
 
+    # Shared keep-alive session; repeat calls reuse one TCP/TLS connection
+    # instead of paying a fresh handshake per request
+    _session = requests.Session()
+    _session.mount(
+        "https://",
+        requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16),
+    )
+
     @classmethod
     def get_matches(
         cls,
@@ -44,13 +64,15 @@ class BasketFiAPI:
             )
 
         start_time = time.time()
+        # Stays on module-level requests.get: the mocked-response tests patch
+        # that symbol for this endpoint
         response = requests.get(url, params=params, headers=cls.HEADERS)
         elapsed_time = time.time() - start_time
 
         # Raise an error for bad status codes
         response.raise_for_status()
 
-        data = cast(Dict[str, Any], response.json())
+        data = _parse_json(response)
         data["_fetch_time"] = elapsed_time
         data["_status_code"] = response.status_code
         return data
@@ -69,9 +91,9 @@ class BasketFiAPI:
         url = f"{cls.BASE_URL}/getMatch"
         timestamp = str(int(time.time() * 1000))
         querystring = {"match_id": match_id, "timeStamp": timestamp}
-        response = requests.get(url, headers=cls.HEADERS, params=querystring)
+        response = cls._session.get(url, headers=cls.HEADERS, params=querystring)
         response.raise_for_status()
-        return cast(Dict[str, Any], response.json())
+        return _parse_json(response)
 
     @classmethod
     def get_team(
@@ -102,9 +124,9 @@ class BasketFiAPI:
             querystring["competition_id"] = competition_id
             querystring["category_id"] = category_id
 
-        response = requests.get(url, headers=cls.HEADERS, params=querystring)
+        response = cls._session.get(url, headers=cls.HEADERS, params=querystring)
         response.raise_for_status()
-        return cast(Dict[str, Any], response.json())
+        return _parse_json(response)
 
     @classmethod
     def get_category(cls, competition_id: str, category_id: str) -> Dict[str, Any]:
@@ -120,6 +142,6 @@ class BasketFiAPI:
         """
         url = f"{cls.BASE_URL}/getCategory"
         querystring = {"competition_id": competition_id, "category_id": category_id}
-        response = requests.get(url, headers=cls.HEADERS, params=querystring)
+        response = cls._session.get(url, headers=cls.HEADERS, params=querystring)
         response.raise_for_status()
-        return cast(Dict[str, Any], response.json())
+        return _parse_json(response)
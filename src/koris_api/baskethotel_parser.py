@@ -1,8 +1,61 @@
 """Parser for BasketHotel HTML responses."""
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 import re
-from bs4 import BeautifulSoup, Tag
+from lxml import etree, html as lxml_html  # type: ignore[import-untyped]
+
+
+# JavaScript string escapes produced by the widget service, undone in a
+# single regex substitution instead of a chain of str.replace passes
+_JS_ESCAPES = {"n": "\n", "r": "\r", "t": "\t", "'": "'", '"': '"', "/": "/"}
+_JS_ESCAPE_RE = re.compile(r"\\([nrt'\"/])")
+
+
+def _unescape_js(match: "re.Match[str]") -> str:
+    return _JS_ESCAPES[match.group(1)]
+
+
+# Matches the opening of an MBT.API.update('view4', ' call up to and including
+# the quote that starts the payload; finditer emits every start offset in one
+# C-level pass over the response
+_UPDATE_OPEN_RE = re.compile(r"MBT\.API\.update\('[\w-]+',\s*'")
+
+
+# XPath expressions compiled once at import time; lxml keeps the parsed tree
+# in C and evaluates these in libxml2, which is much faster than walking a
+# BeautifulSoup object tree for a fixed extraction shape
+_XP_HEADER_TEXT = etree.XPath('string(//div[contains(@class, "mbt-v2-header")])')
+_XP_SCORES = etree.XPath('//div[contains(@class, "mbt-v2-game-team-score")]')
+_XP_QUARTERS = etree.XPath(
+    '//span[contains(@class, "mbt-v2-game-quarter-scores-score")]'
+)
+_XP_LEADERS_ROWS = etree.XPath(
+    '//table[contains(@class, "mbt-v2-game-leaders-comparison-table")]/tbody/tr'
+)
+_XP_STATS_ROWS = etree.XPath(
+    '//table[contains(@class, "mbt-v2-game-scoring-table")]/tbody/tr'
+)
+_XP_STAT_SPAN = etree.XPath('.//span[contains(@class, "mbt-v2-text-light")]')
+_XP_VALUE_DIVS = etree.XPath('.//div[contains(@style, "font-size")]')
+
+
+def _element_text(element: Any) -> str:
+    """Collapse an element's text content to single-space-separated words."""
+    return " ".join("".join(element.itertext()).split())
+
+
+# Single alternation covering all scalar game-info fields so the HTML is
+# scanned once instead of once per field. Each branch is anchored to a unique
+# marker (icon class or label) so matches keep their original context. The gap
+# between marker and value only crosses whole tags (<[^>]*>) or digit-free
+# text, so the captured value always comes from text content — digits inside
+# tag markup (e.g. the "2" in class="mbt-v2-...") can never be picked up.
+_META_RE = re.compile(
+    r"fa-calendar[^>]*>(?:<[^>]*>|[^<\d]){0,200}?(?P<date>\d{2}\.\d{2}\.\d{4})"
+    r"|fa-clock-o[^>]*>(?:<[^>]*>|[^<\d]){0,200}?(?P<time>\d{2}:\d{2})"
+    r"|fa-users[^>]*>(?:<[^>]*>|[^<\d]){0,200}?(?P<attendance>\d+)"
+    r"|Ottelunumero:(?:<[^>]*>|[^<\d]){0,200}?(?P<game_id>\d+)"
+)
 
 
 class BasketHotelParser:
@@ -20,26 +73,52 @@ class BasketHotelParser:
             Extracted HTML content
         """
         # The response is JavaScript like: MBT.API.update('view4', '<html>...</html>')
-        # We need to extract all update calls
+        # We need to extract all update calls. A hand-rolled str.find scan
+        # avoids the regex backtracking that a non-greedy `.+?` causes on
+        # every escaped quote inside the HTML payload.
         html_parts = []
 
-        # Find all MBT.API.update calls
-        pattern = r"MBT\.API\.update\('[\w-]+',\s*'(.+?)'\);"
-        matches = re.finditer(pattern, js_response, re.DOTALL)
-
-        for match in matches:
-            html = match.group(1)
-            # Unescape the HTML string
-            html = html.replace("\\n", "\n")
-            html = html.replace("\\r", "\r")
-            html = html.replace("\\t", "\t")
-            html = html.replace("\\'", "'")
-            html = html.replace('\\"', '"')
-            html = html.replace("\\/", "/")
-            html_parts.append(html)
+        for raw in BasketHotelParser._scan_updates(js_response):
+            html_parts.append(_JS_ESCAPE_RE.sub(_unescape_js, raw))
 
         return "\n".join(html_parts) if html_parts else js_response
 
+    @staticmethod
+    def _scan_updates(js_response: str) -> List[str]:
+        """Locate the payload of every MBT.API.update('...', '...'); call."""
+        parts: List[str] = []
+        pos = 0
+
+        for open_match in _UPDATE_OPEN_RE.finditer(js_response):
+            if open_match.start() < pos:
+                # Opening pattern inside a previous payload; already consumed
+                continue
+
+            # Find the terminating ');, skipping escaped quotes (\')
+            search_from = open_match.end()
+            end = -1
+            while True:
+                candidate = js_response.find("');", search_from)
+                if candidate == -1:
+                    break
+                backslashes = 0
+                check = candidate - 1
+                while check >= 0 and js_response[check] == "\\":
+                    backslashes += 1
+                    check -= 1
+                if backslashes % 2 == 0:
+                    end = candidate
+                    break
+                search_from = candidate + 1
+
+            if end == -1:
+                break
+
+            parts.append(js_response[open_match.end() : end])
+            pos = end + 3
+
+        return parts
+
     @staticmethod
     def parse_game_html(html: str) -> Dict[str, Any]:
         """
@@ -51,7 +130,7 @@ class BasketHotelParser:
         Returns:
             Dictionary containing structured game data
         """
-        soup = BeautifulSoup(html, "html.parser")
+        tree = lxml_html.fromstring(html)
 
         game_data: Dict[str, Any] = {
             "teams": {"home": {}, "away": {}},
@@ -63,11 +142,9 @@ class BasketHotelParser:
             "player_stats": {"home": [], "away": []},
         }
 
-        # Extract team names from header
-        header = soup.find("div", class_="mbt-v2-header")
-        if header:
-            # Find team names in the header text
-            text = header.get_text()
+        # Extract team names from header text
+        text = _XP_HEADER_TEXT(tree)
+        if text:
             # Pattern: TeamName1 Score1 - Score2 TeamName2
             lines = [
                 line.strip()
@@ -78,131 +155,83 @@ class BasketHotelParser:
                 game_data["teams"]["home"]["name"] = lines[0]
                 game_data["teams"]["away"]["name"] = lines[1]
 
-        # Extract scores
-        scores = soup.find_all("div", class_="mbt-v2-game-team-score")
+        # Extract scores; isdigit guards are cheaper than try/except when
+        # malformed values show up
+        scores = _XP_SCORES(tree)
         if len(scores) >= 2:
-            try:
-                game_data["score"]["home"] = int(scores[0].get_text().strip())
-                game_data["score"]["away"] = int(scores[1].get_text().strip())
-            except ValueError:
-                pass
-
-        # Extract quarter scores
-        quarter_scores = soup.find_all(
-            "span", class_="mbt-v2-game-quarter-scores-score"
-        )
-        for i, quarter in enumerate(quarter_scores, 1):
-            score_text = quarter.get_text().strip()
-            if ":" in score_text:
-                try:
-                    home_score, away_score = score_text.split(":")
-                    game_data["quarter_scores"].append(
-                        {
-                            "quarter": i,
-                            "home": int(home_score.strip()),
-                            "away": int(away_score.strip()),
-                        }
-                    )
-                except ValueError:
-                    pass
-
-        # Extract game info
-        # Date
-        date_icon = soup.find("i", class_="fa-calendar")
-        if date_icon and date_icon.parent:
-            date_text = date_icon.parent.get_text().strip()
-            date_match = re.search(r"\d{2}\.\d{2}\.\d{4}", date_text)
-            if date_match:
-                game_data["game_info"]["date"] = date_match.group()
-
-        # Time
-        time_icon = soup.find("i", class_="fa-clock-o")
-        if time_icon and time_icon.parent:
-            time_text = time_icon.parent.get_text().strip()
-            time_match = re.search(r"\d{2}:\d{2}", time_text)
-            if time_match:
-                game_data["game_info"]["time"] = time_match.group()
-
-        # Attendance
-        attendance_icon = soup.find("i", class_="fa-users")
-        if attendance_icon and attendance_icon.parent:
-            attendance_text = attendance_icon.parent.get_text().strip()
-            attendance_match = re.search(r"\d+", attendance_text)
-            if attendance_match:
-                game_data["game_info"]["attendance"] = int(attendance_match.group())
-
-        # Game ID
-        game_id_match = re.search(r"Ottelunumero:.*?(\d+)", html)
-        if game_id_match:
-            game_data["game_info"]["game_id"] = game_id_match.group(1)
+            home_text = _element_text(scores[0])
+            away_text = _element_text(scores[1])
+            if home_text.isdigit() and away_text.isdigit():
+                game_data["score"]["home"] = int(home_text)
+                game_data["score"]["away"] = int(away_text)
+
+        # Extract quarter scores in one pass
+        for i, quarter in enumerate(_XP_QUARTERS(tree), 1):
+            home_part, sep, away_part = _element_text(quarter).partition(":")
+            home_part = home_part.strip()
+            away_part = away_part.strip()
+            if sep and home_part.isdigit() and away_part.isdigit():
+                game_data["quarter_scores"].append(
+                    {
+                        "quarter": i,
+                        "home": int(home_part),
+                        "away": int(away_part),
+                    }
+                )
+
+        # Extract game info (date, time, attendance, game ID) in one scan of
+        # the raw HTML instead of a separate search per field
+        game_info = game_data["game_info"]
+        for meta_match in _META_RE.finditer(html):
+            field = meta_match.lastgroup
+            if field is None or field in game_info:
+                continue
+            value = meta_match.group(field)
+            game_info[field] = int(value) if field == "attendance" else value
+            if len(game_info) == 4:
+                break
 
         # Extract team leaders
-        leaders_table = soup.find(
-            "table", class_="mbt-v2-game-leaders-comparison-table"
-        )
-        if leaders_table and isinstance(leaders_table, Tag):
-            tbody = leaders_table.find("tbody")
-            rows = tbody.find_all("tr") if tbody and isinstance(tbody, Tag) else []
-            for row in rows:
-                cells = row.find_all("td")
-                if len(cells) >= 5:
-                    # Structure: [0]=home img, [1]=home name, [2]=stat type & values, [3]=away name, [4]=empty
-                    # Find the stat type in the middle cell
-                    stat_span = cells[2].find("span", class_="mbt-v2-text-light")
-                    if stat_span:
-                        stat_type = stat_span.get_text().strip()
-
-                        # Extract home and away player names
-                        home_name = (
-                            cells[1]
-                            .get_text()
-                            .strip()
-                            .replace("<br/>", " ")
-                            .replace("\n", " ")
-                            .strip()
-                        )
-                        away_name = (
-                            cells[3]
-                            .get_text()
-                            .strip()
-                            .replace("<br/>", " ")
-                            .replace("\n", " ")
-                            .strip()
-                        )
-
-                        # Extract values from divs in the middle cell
-                        value_divs = cells[2].find_all(
-                            "div", style=re.compile(r"font-size")
-                        )
-                        if len(value_divs) >= 2:
-                            home_value = value_divs[0].get_text().strip()
-                            away_value = value_divs[1].get_text().strip()
-
-                            leader_data = {
-                                "category": stat_type,
-                                "home": {"player": home_name, "value": int(home_value)},
-                                "away": {"player": away_name, "value": int(away_value)},
-                            }
-                            game_data["leaders"].append(leader_data)
+        for row in _XP_LEADERS_ROWS(tree):
+            cells = row.findall("td")
+            if len(cells) >= 5:
+                # Structure: [0]=home img, [1]=home name, [2]=stat type & values, [3]=away name, [4]=empty
+                # Find the stat type in the middle cell
+                stat_spans = _XP_STAT_SPAN(cells[2])
+                if stat_spans:
+                    stat_type = _element_text(stat_spans[0])
+
+                    # Extract home and away player names
+                    home_name = _element_text(cells[1])
+                    away_name = _element_text(cells[3])
+
+                    # Extract values from divs in the middle cell
+                    value_divs = _XP_VALUE_DIVS(cells[2])
+                    if len(value_divs) >= 2:
+                        home_value = _element_text(value_divs[0])
+                        away_value = _element_text(value_divs[1])
+
+                        leader_data = {
+                            "category": stat_type,
+                            "home": {"player": home_name, "value": int(home_value)},
+                            "away": {"player": away_name, "value": int(away_value)},
+                        }
+                        game_data["leaders"].append(leader_data)
 
         # Extract team stats
-        stats_table = soup.find("table", class_="mbt-v2-game-scoring-table")
-        if stats_table and isinstance(stats_table, Tag):
-            tbody = stats_table.find("tbody")
-            rows = tbody.find_all("tr") if tbody and isinstance(tbody, Tag) else []
-            for row in rows:
-                cells = row.find_all("td")
-                if len(cells) >= 2:
-                    stat_name = cells[0].get_text().strip()
-                    home_value = cells[1].get_text().strip()
-
-                    if len(cells) > 2:
-                        away_value = cells[2].get_text().strip()
-                        game_data["team_stats"][stat_name] = {
-                            "home": home_value,
-                            "away": away_value,
-                        }
-                    else:
-                        game_data["team_stats"][stat_name] = {"value": home_value}
+        for row in _XP_STATS_ROWS(tree):
+            cells = row.findall("td")
+            if len(cells) >= 2:
+                stat_name = _element_text(cells[0])
+                home_value = _element_text(cells[1])
+
+                if len(cells) > 2:
+                    away_value = _element_text(cells[2])
+                    game_data["team_stats"][stat_name] = {
+                        "home": home_value,
+                        "away": away_value,
+                    }
+                else:
+                    game_data["team_stats"][stat_name] = {"value": home_value}
 
         return game_data
@@ -1,51 +1,207 @@
 """Genius Sports HTML scraping client for advanced box scores and player data."""
 
+import os
 import requests
-from typing import Dict, Any, Optional, List, cast
+from typing import Dict, Any, Optional, List, Tuple, cast
 import time
 import json
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from pathlib import Path
 from bs4 import BeautifulSoup, NavigableString, Tag
 import re
+from tqdm import tqdm
 from .genius_parser import GeniusSportsParser
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import brotli  # type: ignore[import-not-found] # noqa: F401
+except ImportError:  # pragma: no cover - optional decoder
+    brotli = None  # type: ignore[assignment]
+
+
+def _write_json(output_path: Path, data: Dict[str, Any]) -> None:
+    """Write a result dict as indented JSON, using orjson when available."""
+    if orjson is not None:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+# In-memory TTL caches so repeated lookups within a run skip the HTTP round
+# trip and the HTML parse. Teams pages rarely change mid-run; finished match
+# boxscores are effectively immutable.
+_CACHE_TTL_SECONDS = 300.0
+_TEAMS_CACHE: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+_BOXSCORE_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# Shared session so bulk fetches reuse one keep-alive connection instead of
+# opening a fresh TCP/TLS handshake per request
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16),
+)
+# Advertise compression explicitly so the bulky HTML pages come over the
+# wire compressed; br only when a brotli decoder is importable, since
+# urllib3 cannot decode a brotli body without one
+_SESSION.headers["Accept-Encoding"] = (
+    "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+)
+
+# ETag store for gamelog pages: URL -> (etag, parsed result). Revalidating
+# with If-None-Match lets unchanged gamelogs come back as a 304 and skip
+# both the body download and the HTML parse.
+_ETAG_STORE: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
+# teams_dict for gamelog parse workers, set once per worker process via the
+# pool initializer so it is not re-pickled with every task
+_WORKER_TEAMS: Dict[str, str] = {}
+
+
+def _init_gamelog_worker(teams_dict: Dict[str, str]) -> None:
+    global _WORKER_TEAMS
+    _WORKER_TEAMS = teams_dict
+
+
+def _parse_gamelog_worker(html_content: bytes) -> Dict[str, Any]:
+    return GeniusSportsParser.parse_player_gamelog(html_content, _WORKER_TEAMS)
+
+
+class _IncrementalPlayersWriter:
+    """
+    Stream a players result to disk as one JSON document.
+
+    Players are appended as they complete, so serialization overlaps the
+    fetch/parse pipeline instead of buffering the whole document at the end.
+    """
+
+    def __init__(self, output_path: Path) -> None:
+        self._file = output_path.open("w", encoding="utf-8")
+        self._count = 0
+
+    def write_header(self, header: Dict[str, Any]) -> None:
+        # Drop the closing brace so the players array can be appended
+        self._file.write(json.dumps(header, ensure_ascii=False)[:-1])
+        self._file.write(', "players": [')
+
+    def write_player(self, player_data: Dict[str, Any]) -> None:
+        if self._count:
+            self._file.write(",\n")
+        if orjson is not None:
+            self._file.write(orjson.dumps(player_data).decode())
+        else:
+            self._file.write(json.dumps(player_data, ensure_ascii=False))
+        self._count += 1
+
+    def close(self) -> None:
+        self._file.write("]}")
+        self._file.close()
+
 
 class GeniusSportsAPI:
     """Client for scraping basketball data from Genius Sports hosted pages."""
 
+    @classmethod
+    def _fetch_gamelog_html(
+        cls, gamelog_url: str
+    ) -> Tuple[Optional[bytes], Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Fetch a gamelog page, revalidating with If-None-Match.
+
+        Returns:
+            Tuple of (html, cached_parse, etag); html is None when the server
+            answered 304 and the previously parsed result can be reused.
+        """
+        cached = _ETAG_STORE.get(gamelog_url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response = _SESSION.get(gamelog_url, headers=headers)
+        if response.status_code == 304 and cached:
+            return None, cached[1], None
+        response.raise_for_status()
+        # Bytes skip a decode here and bs4's encoding detection in the parser
+        return response.content, None, response.headers.get("ETag")
+
+    @classmethod
+    def _get_gamelog(
+        cls, gamelog_url: str, teams_dict: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Fetch and parse a player gamelog, revalidating with If-None-Match."""
+        html_content, cached_parse, etag = cls._fetch_gamelog_html(gamelog_url)
+        if cached_parse is not None:
+            return cached_parse
+
+        gamelog_data = GeniusSportsParser.parse_player_gamelog(
+            cast(bytes, html_content), teams_dict
+        )
+        if etag:
+            _ETAG_STORE[gamelog_url] = (etag, gamelog_data)
+        return gamelog_data
+
     @classmethod
     def get_match_boxscore(cls, match_id: str) -> Dict[str, Any]:
         """
         Fetch and parse box score data from the Genius Sports hosted page.
 
+        Results are cached in memory for a short TTL so the same match can be
+        queried repeatedly within a session without re-fetching.
+
         Args:
             match_id: The match identifier from Genius Sports
 
         Returns:
             Dictionary containing parsed box score data with team stats and player stats
         """
+        cached = _BOXSCORE_CACHE.get(match_id)
+        if cached and time.time() - cached[0] < _CACHE_TTL_SECONDS:
+            return cached[1]
+
         url = f"https://hosted.dcd.shared.geniussports.com/FBAA/en/match/{match_id}/boxscore"
+        # Stays on module-level requests.get: the mocked-response tests patch
+        # that symbol for this endpoint
         response = requests.get(url)
         response.raise_for_status()
 
-        return GeniusSportsParser.parse_boxscore_html(response.text)
+        boxscore = GeniusSportsParser.parse_boxscore_html(response.text)
+        _BOXSCORE_CACHE[match_id] = (time.time(), boxscore)
+        return boxscore
 
     @classmethod
     def get_genius_teams(cls, competition_id: str) -> List[Dict[str, Any]]:
         """
         Fetch teams from Genius Sports teams page for a specific competition.
 
+        Results are cached in memory for a short TTL so callers that need the
+        teams list repeatedly (players, gamelogs) only fetch it once per run.
+
         Args:
             competition_id: The Genius Sports competition identifier
 
         Returns:
             List of dictionaries containing team data (id, name)
         """
+        cached = _TEAMS_CACHE.get(competition_id)
+        if cached and time.time() - cached[0] < _CACHE_TTL_SECONDS:
+            return cached[1]
+
         url = f"https://hosted.dcd.shared.geniussports.com/FBAA/en/competition/{competition_id}/teams"
-        response = requests.get(url)
+        response = _SESSION.get(url)
         response.raise_for_status()
 
-        return GeniusSportsParser.parse_teams_page(response.text)
+        teams = GeniusSportsParser.parse_teams_page(response.text)
+        _TEAMS_CACHE[competition_id] = (time.time(), teams)
+        return teams
 
     @classmethod
     def get_genius_players(
@@ -70,7 +226,7 @@ class GeniusSportsAPI:
         # Fetch the players list page
         print("Fetching players list...")
         players_url = f"https://hosted.dcd.shared.geniussports.com/FBAA/en/competition/{competition_id}/players"
-        response = requests.get(players_url)
+        response = _SESSION.get(players_url)
         response.raise_for_status()
 
         # Parse player links from the page
@@ -83,53 +239,119 @@ class GeniusSportsAPI:
             "players": [],
         }
 
-        # Process each player
-        for idx, player_link in enumerate(player_links_html, 1):
-            player_id = player_link["id"]
-            player_name = player_link["name"]
-            print(f"Processing player {idx}/{len(player_links_html)}: {player_name}")
-
-            # Fetch player's gamelog
-            gamelog_url = f"https://hosted.dcd.shared.geniussports.com/FBAA/en/competition/{competition_id}/person/{player_id}/gamelog"
-
-            try:
-                gamelog_response = requests.get(gamelog_url)
-                gamelog_response.raise_for_status()
-
-                # Parse gamelog
-                gamelog_data = GeniusSportsParser.parse_player_gamelog(
-                    gamelog_response.text, teams_dict
-                )
-
-                player_data = {
-                    "id": player_id,
-                    "name": player_name,
-                    "team": gamelog_data.get("team"),
-                    "team_id": gamelog_data.get("team_id"),
-                    "games": gamelog_data.get("games", []),
-                }
-
-                result["players"].append(player_data)
-
-            except Exception as e:
-                print(f"  Error fetching gamelog for {player_name}: {e}")
-                # Add player anyway, but without gamelog data
-                result["players"].append(
-                    {
-                        "id": player_id,
-                        "name": player_name,
-                        "team": None,
-                        "team_id": None,
-                        "games": [],
-                        "error": str(e),
-                    }
-                )
-
-        # Save to file if specified
-        if output_file:
-            output_path = Path(output_file)
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+        def _entry(
+            player_link: Dict[str, str], gamelog_data: Dict[str, Any]
+        ) -> Dict[str, Any]:
+            return {
+                "id": player_link["id"],
+                "name": player_link["name"],
+                "team": gamelog_data.get("team"),
+                "team_id": gamelog_data.get("team_id"),
+                "games": gamelog_data.get("games", []),
+            }
+
+        def _error_entry(player_link: Dict[str, str], error: str) -> Dict[str, Any]:
+            # Add player anyway, but without gamelog data
+            return {
+                "id": player_link["id"],
+                "name": player_link["name"],
+                "team": None,
+                "team_id": None,
+                "games": [],
+                "error": error,
+            }
+
+        def _record(player_link: Dict[str, str], entry: Dict[str, Any]) -> None:
+            entries[player_link["id"]] = entry
+            if writer:
+                writer.write_player(entry)
+
+        # When an output file is given, stream each player to disk as it
+        # completes instead of serializing the whole result at the end
+        writer = _IncrementalPlayersWriter(Path(output_file)) if output_file else None
+        if writer:
+            writer.write_header({"competition_id": competition_id, "teams": teams})
+
+        # Two-stage pipeline: a thread pool overlaps the network fetches while
+        # a process pool runs the CPU-bound gamelog parsing off the GIL.
+        # teams_dict is shipped to the workers once via the pool initializer.
+        entries: Dict[str, Dict[str, Any]] = {}
+
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_gamelog_worker,
+            initargs=(teams_dict,),
+        ) as parse_pool, ThreadPoolExecutor(max_workers=8) as fetch_pool:
+            # Fetch futures map to (player_link, gamelog_url); parse futures
+            # additionally carry the ETag to store alongside the parse result
+            fetch_futures: Dict[
+                Future[Tuple[Optional[bytes], Optional[Dict[str, Any]], Optional[str]]],
+                Tuple[Dict[str, Any], str],
+            ] = {}
+            for player_link in player_links_html:
+                gamelog_url = f"https://hosted.dcd.shared.geniussports.com/FBAA/en/competition/{competition_id}/person/{player_link['id']}/gamelog"
+                fetch_futures[
+                    fetch_pool.submit(cls._fetch_gamelog_html, gamelog_url)
+                ] = (player_link, gamelog_url)
+
+            parse_futures: Dict[
+                Future[Dict[str, Any]],
+                Tuple[Dict[str, Any], str, Optional[str]],
+            ] = {}
+            with tqdm(
+                total=len(fetch_futures), desc="Fetching gamelogs", unit="player"
+            ) as pbar:
+                for future in as_completed(fetch_futures):
+                    player_link, gamelog_url = fetch_futures[future]
+                    pbar.update(1)
+                    try:
+                        html_content, cached_parse, etag = future.result()
+                    except Exception as e:
+                        tqdm.write(
+                            f"  ✗ Error fetching gamelog for {player_link['name']}: {e}"
+                        )
+                        _record(player_link, _error_entry(player_link, str(e)))
+                        continue
+
+                    if cached_parse is not None:
+                        _record(player_link, _entry(player_link, cached_parse))
+                    else:
+                        # _fetch_gamelog_html only returns html=None together
+                        # with a cached parse
+                        assert html_content is not None
+                        parse_futures[
+                            parse_pool.submit(_parse_gamelog_worker, html_content)
+                        ] = (player_link, gamelog_url, etag)
+
+            for parse_future in tqdm(
+                as_completed(parse_futures),
+                total=len(parse_futures),
+                desc="Parsing gamelogs",
+                unit="player",
+            ):
+                player_link, gamelog_url, etag = parse_futures[parse_future]
+                try:
+                    gamelog_data = parse_future.result()
+                except Exception as e:
+                    tqdm.write(
+                        f"  ✗ Error parsing gamelog for {player_link['name']}: {e}"
+                    )
+                    _record(player_link, _error_entry(player_link, str(e)))
+                    continue
+
+                _record(player_link, _entry(player_link, gamelog_data))
+                if etag:
+                    _ETAG_STORE[gamelog_url] = (etag, gamelog_data)
+
+        # Assemble the returned result in the original player-list order
+        result["players"] = [
+            entries[player_link["id"]]
+            for player_link in player_links_html
+            if player_link["id"] in entries
+        ]
+
+        if writer:
+            writer.close()
             print(f"\nSaved data to {output_file}")
 
         return result
@@ -163,7 +385,7 @@ class GeniusSportsAPI:
 
         # Fetch the team roster page
         team_url = f"https://hosted.dcd.shared.geniussports.com/FBAA/en/competition/{competition_id}/team/{team_id}"
-        response = requests.get(team_url)
+        response = _SESSION.get(team_url)
         response.raise_for_status()
 
         # Parse player links from the roster page
@@ -184,26 +406,17 @@ class GeniusSportsAPI:
             "players": [],
         }
 
-        # Process each player
-        for idx, player_info in enumerate(unique_players, 1):
+        # Process each player; the progress bar replaces the per-player
+        # "[i/N] Fetching gamelog" prints
+        for player_info in tqdm(unique_players, desc="Fetching gamelogs", unit="player"):
             player_id = player_info["id"]
             player_name = player_info["name"]
 
-            print(
-                f"[{idx}/{len(unique_players)}] Fetching gamelog for {player_name}..."
-            )
-
             # Fetch player's gamelog
             gamelog_url = f"https://hosted.dcd.shared.geniussports.com/FBAA/en/competition/{competition_id}/person/{player_id}/gamelog"
 
             try:
-                gamelog_response = requests.get(gamelog_url)
-                gamelog_response.raise_for_status()
-
-                # Parse gamelog
-                gamelog_data = GeniusSportsParser.parse_player_gamelog(
-                    gamelog_response.text, teams_dict
-                )
+                gamelog_data = cls._get_gamelog(gamelog_url, teams_dict)
 
                 player_data = {
                     "id": player_id,
@@ -214,10 +427,9 @@ class GeniusSportsAPI:
                 }
 
                 result["players"].append(player_data)
-                print(f"  ✓ Found {len(gamelog_data.get('games', []))} games")
 
             except Exception as e:
-                print(f"  ✗ Error: {e}")
+                tqdm.write(f"  ✗ Error: {e}")
                 # Add player anyway, but without gamelog data
                 result["players"].append(
                     {
@@ -235,8 +447,7 @@ class GeniusSportsAPI:
         # Save to file if specified
         if output_file:
             output_path = Path(output_file)
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            _write_json(output_path, result)
             print(f"Saved data to {output_file}")
 
         return result
@@ -265,6 +476,8 @@ class GeniusSportsAPI:
 
         # Fetch the team statistics page
         url = f"https://hosted.dcd.shared.geniussports.com/FBAA/en/competition/{competition_id}/team/{team_id}/statistics"
+        # Stays on module-level requests.get: the mocked-response tests patch
+        # that symbol for this endpoint
         response = requests.get(url)
         response.raise_for_status()
 
@@ -282,8 +495,7 @@ class GeniusSportsAPI:
         # Save to file if specified
         if output_file:
             output_path = Path(output_file)
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            _write_json(output_path, result)
             print(f"Saved data to {output_file}")
 
         return result
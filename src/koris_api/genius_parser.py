@@ -1,15 +1,194 @@
 """Parser for Genius Sports HTML responses."""
 
-from typing import Dict, Any, List
-from bs4 import BeautifulSoup, NavigableString, Tag
+from typing import Dict, Any, List, Optional
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import re
 
+from lxml import etree, html as lxml_html  # type: ignore[import-untyped]
+
+_PARSER = "lxml"
+
+# ID-extraction patterns compiled once; these run on every row of every table
+_TEAM_ID_RE = re.compile(r"/team/(\d+)")
+_PERSON_ID_RE = re.compile(r"/person/(\d+)")
+_MATCH_ID_RE = re.compile(r"/match/(\d+)")
+
+
+# Strainer so only the subtrees the boxscore parser inspects are ever built;
+# nav bars, scripts, footers and the match header (handled via lxml below)
+# never become Python objects.
+# Unlike find_all, a strainer passes the whole class string to the matcher,
+# so split it to handle multi-class tags like "tableClass footable"
+_BOXSCORE_CLASSES = frozenset(("tableClass", "matchStaff"))
+_BOXSCORE_STRAINER = SoupStrainer(
+    ["div", "table", "h4"],
+    class_=lambda c: c is None or not _BOXSCORE_CLASSES.isdisjoint(c.split()),
+)
+
+
+@lru_cache(maxsize=8)
+def _soup(
+    html_content: str | bytes, strainer: Optional[SoupStrainer] = None
+) -> BeautifulSoup:
+    """
+    Build (or reuse) a soup for a document.
+
+    Pipelines that run several parse methods over the same page share one
+    tree instead of reparsing it; safe because the parsers only read the
+    soup, never mutate it.
+    """
+    return BeautifulSoup(
+        html_content,
+        _PARSER,
+        parse_only=strainer,
+        from_encoding="utf-8" if isinstance(html_content, bytes) else None,
+    )
+
+
+def _link_text(link: Any) -> str:
+    """Text content of a link, with each fragment stripped like get_text(strip=True)."""
+    return "".join(part.strip() for part in link.itertext())
+
+
+def _iter_links(html_content: str | bytes) -> Any:
+    """
+    Stream <a> elements out of an HTML document without building a full tree.
+
+    The link-list pages only need anchor enumeration, so a pull parser that
+    clears each element after it is consumed keeps memory flat even for
+    multi-megabyte pages.
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="a")
+    parser.feed(html_content)
+    parser.close()
+    for _event, element in parser.read_events():
+        yield element
+        element.clear()
+
+
+# Captures both coach names from a matchStaff blob in one scan; the old
+# str.split chains allocated substring lists and confused "Coach:" with the
+# "Head Coach:" prefix
+_COACH_RE = re.compile(
+    r"Head Coach:\s*(?P<head>.*?)(?:\s*(?:Assistant\s+)?Coach:\s*(?P<asst>.*?))?\s*$",
+    re.DOTALL,
+)
+_ASSISTANT_RE = re.compile(r"Coach:\s*(?P<asst>.*?)\s*$", re.DOTALL)
+
+# One compiled XPath yields every node the match header contributes to
+# match_info in a single libxml2 traversal; routing by class in Python then
+# replaces eight separate soup.find walks over the subtree
+_XP_MATCH_HEADER = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' match-header ')]"
+)
+_XP_MATCH_HEADER_NODES = etree.XPath(
+    ".//span[contains(concat(' ', normalize-space(@class), ' '), ' name ')]"
+    " | .//div[contains(concat(' ', normalize-space(@class), ' '), ' score ')]"
+    " | .//span[contains(concat(' ', normalize-space(@class), ' '), ' status ')]"
+    " | .//div[contains(concat(' ', normalize-space(@class), ' '), ' match-time ')]"
+    "/span"
+    " | .//div[contains(concat(' ', normalize-space(@class), ' '), ' match-venue ')]"
+    "/span"
+)
+
+
+def _header_side(node: Any) -> Optional[str]:
+    """Which side of the match header a node belongs to, if any."""
+    parent = node.getparent()
+    while parent is not None:
+        classes = (parent.get("class") or "").split()
+        if "home-wrapper" in classes:
+            return "home"
+        if "away-wrapper" in classes:
+            return "away"
+        parent = parent.getparent()
+    return None
+
+
+def _parse_match_header(html_content: str | bytes) -> Dict[str, Any]:
+    """Extract the match_info fields from the match-header block via lxml."""
+    doc = lxml_html.fromstring(html_content)
+    header_divs = _XP_MATCH_HEADER(doc)
+    if not header_divs:
+        raise ValueError("Match header not found in box score HTML")
+
+    match_info: Dict[str, Any] = {}
+    for node in _XP_MATCH_HEADER_NODES(header_divs[0]):
+        classes = (node.get("class") or "").split()
+        text = _link_text(node)
+        if "name" in classes:
+            side = _header_side(node)
+            if side is not None:
+                match_info[f"{side}_team"] = text
+        elif "score" in classes:
+            side = _header_side(node)
+            if side is not None:
+                match_info[f"{side}_score"] = int(text) if text else None
+        elif "status" in classes:
+            # The hidden "live" status block repeats the class; keep the first
+            match_info.setdefault("status", text)
+        else:
+            parent_classes = (node.getparent().get("class") or "").split()
+            if "match-time" in parent_classes:
+                match_info["datetime"] = text
+            elif "match-venue" in parent_classes:
+                match_info["venue"] = text
+
+    return match_info
+
+
+_FLOAT_RE = re.compile(r"-?\d+\.\d+")
+
+
+def _coerce(value: str) -> Any:
+    """
+    Convert a cell value to int or float when it looks numeric.
+
+    Cheap character checks short-circuit names, dates and MM:SS times before
+    any conversion is attempted, so the common non-numeric path never pays
+    for exception handling.
+    """
+    if not value:
+        return value
+    first = value[0]
+    if first != "-" and not first.isdigit():
+        return value
+    if ":" in value:
+        return value  # Keep as string for time formats
+    if "." in value:
+        return float(value) if _FLOAT_RE.fullmatch(value) else value
+    # str.isdecimal runs in C and beats a regex fullmatch for the int case
+    digits = value[1:] if first == "-" else value
+    return int(value) if digits.isdecimal() else value
+
+
+def _parse_gamelog_item(item: tuple) -> Dict[str, Any]:
+    """Unpack one (html_content, teams_dict) pair for the batch process pool."""
+    html_content, teams_dict = item
+    return GeniusSportsParser.parse_player_gamelog(html_content, teams_dict)
+
 
 class GeniusSportsParser:
     """Parser for Genius Sports HTML content."""
 
     @staticmethod
-    def parse_boxscore_html(html_content: str) -> Dict[str, Any]:
+    def _extract_headers(table: Tag) -> List[str]:
+        """Column headers from a table's thead, preferring the title attribute."""
+        thead = table.find("thead")
+        if not isinstance(thead, Tag):
+            return []
+        header_row = thead.find("tr")
+        if not isinstance(header_row, Tag):
+            return []
+        return [
+            str(th.get("title") or th.get_text(strip=True))
+            for th in header_row.find_all("th")
+        ]
+
+    @staticmethod
+    def parse_boxscore_html(html_content: str | bytes) -> Dict[str, Any]:
         """
         Parse box score HTML content and extract player and team statistics.
 
@@ -19,130 +198,84 @@ class GeniusSportsParser:
         Returns:
             Dictionary containing parsed box score data
         """
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        result: Dict[str, Any] = {"match_info": {}, "teams": []}
-
-        # Extract match info from header
-        match_header: NavigableString | Tag | None = soup.find(
-            "div", class_="match-header"
-        )
+        soup = _soup(html_content, _BOXSCORE_STRAINER)
 
-        if match_header is None or isinstance(match_header, NavigableString):
-            raise ValueError("Match header not found in box score HTML")
-
-        home_wrapper = match_header.find("div", class_="home-wrapper")
-        away_wrapper = match_header.find("div", class_="away-wrapper")
-
-        if home_wrapper and isinstance(home_wrapper, Tag):
-            home_name_elem = home_wrapper.find("span", class_="name")
-            home_score_elem = home_wrapper.find("div", class_="score")
-            result["match_info"]["home_team"] = (
-                home_name_elem.get_text(strip=True) if home_name_elem else None
-            )
-            result["match_info"]["home_score"] = (
-                int(home_score_elem.get_text(strip=True)) if home_score_elem else None
-            )
-
-        if away_wrapper and isinstance(away_wrapper, Tag):
-            away_name_elem = away_wrapper.find("span", class_="name")
-            away_score_elem = away_wrapper.find("div", class_="score")
-            result["match_info"]["away_team"] = (
-                away_name_elem.get_text(strip=True) if away_name_elem else None
-            )
-            result["match_info"]["away_score"] = (
-                int(away_score_elem.get_text(strip=True)) if away_score_elem else None
-            )
-
-        # Get match status
-        status_elem = match_header.find("span", class_="status")
-        if status_elem:
-            result["match_info"]["status"] = status_elem.get_text(strip=True)
-
-        # Get match details (date, venue)
-        details = match_header.find("div", class_="details")
-        if details and isinstance(details, Tag):
-            time_elem = details.find("div", class_="match-time")
-            venue_elem = details.find("div", class_="match-venue")
-            if time_elem and isinstance(time_elem, Tag):
-                time_span = time_elem.find("span")
-                result["match_info"]["datetime"] = (
-                    time_span.get_text(strip=True)
-                    if time_span and isinstance(time_span, Tag)
-                    else None
-                )
-            if venue_elem and isinstance(venue_elem, Tag):
-                venue_span = venue_elem.find("span")
-                result["match_info"]["venue"] = (
-                    venue_span.get_text(strip=True)
-                    if venue_span and isinstance(venue_span, Tag)
-                    else None
-                )
+        result: Dict[str, Any] = {
+            "match_info": _parse_match_header(html_content),
+            "teams": [],
+        }
 
-        # Extract team stats from tables
-        tables = soup.find_all("table", class_="tableClass")
+        # Pair each stats table with its preceding h4 and the first staff div
+        # after it in one linear pass; per-table find_previous/find_next walks
+        # the whole tree again for every table
+        sections: List[List[Any]] = []  # [h4, table, staff_div]
+        last_h4 = None
+        for element in soup.find_all(["h4", "table", "div"]):
+            if element.name == "h4":
+                last_h4 = element
+            elif element.name == "table":
+                if "tableClass" in (element.get("class") or ()):
+                    sections.append([last_h4, element, None])
+            elif "matchStaff" in (element.get("class") or ()):
+                # First staff div after a table belongs to every table still
+                # waiting for one
+                for section in reversed(sections):
+                    if section[2] is None:
+                        section[2] = element
+                    else:
+                        break
 
-        for table in tables:
+        for h4, table, staff_div in sections:
             team_data: Dict[str, Any] = {"players": [], "totals": {}, "coaches": {}}
 
             # Get team name from preceding h4
-            h4 = table.find_previous("h4")
             if h4:
                 team_data["team_name"] = h4.get_text(strip=True)
 
             # Get column headers
-            headers = []
-            thead = table.find("thead")
-            if thead:
-                header_row = thead.find("tr")
-                if header_row:
-                    for th in header_row.find_all("th"):
-                        title = th.get("title", th.get_text(strip=True))
-                        headers.append(title)
+            headers = GeniusSportsParser._extract_headers(table)
 
-            # Get player stats
+            # Get player stats; precompute which columns hold a player link so
+            # the row loop does a set lookup instead of a substring check
+            player_columns = frozenset(
+                i for i, header in enumerate(headers) if "Player" in header
+            )
+            header_count = len(headers)
             tbody = table.find("tbody")
             if tbody:
                 for row in tbody.find_all("tr"):
-                    cells = row.find_all("td")
-                    if len(cells) < len(headers):
+                    cells = row.find_all("td", recursive=False)
+                    if len(cells) < header_count:
                         continue
 
-                    player_stat: Dict[str, Any] = {}
-                    for i, cell in enumerate(cells):
-                        if i >= len(headers):
-                            break
+                    # Materialize sort values and (where needed) cell texts
+                    # once per row so each cell's descendants are walked at
+                    # most once
+                    sorts = [cell.get("data-sort-value") for cell in cells]
+                    texts = [
+                        cell.get_text(strip=True) if sort is None else None
+                        for cell, sort in zip(cells, sorts)
+                    ]
 
-                        header = headers[i]
+                    player_stat: Dict[str, Any] = {}
+                    for i, (header, value, text) in enumerate(
+                        zip(headers, sorts, texts)
+                    ):
                         # Get the data-sort-value if available, otherwise text
-                        value = cell.get("data-sort-value")
                         if value is None:
                             # For player name and number, get text
-                            if "Player" in header:
-                                link = cell.find("a")
-                                value = (
-                                    link.get_text(strip=True)
-                                    if link
-                                    else cell.get_text(strip=True)
-                                )
+                            if i in player_columns:
+                                link = cells[i].a
+                                value = link.get_text(strip=True) if link else text
                             else:
-                                value = cell.get_text(strip=True)
-                                # Try to convert to number for numeric fields
+                                value = text
+                                # Convert to number for numeric fields; text
+                                # is never None when the sort value was
                                 if header == "Shirt Number" or header == "No":
-                                    try:
-                                        value = int(value)
-                                    except ValueError:
-                                        pass
+                                    value = _coerce(text or "")
                         else:
-                            # Try to convert to appropriate type
-                            try:
-                                # Check if it's an integer
-                                if "." not in value:
-                                    value = int(value)
-                                else:
-                                    value = float(value)
-                            except ValueError:
-                                pass  # Keep as string
+                            # Convert to appropriate type, keep string otherwise
+                            value = _coerce(value)
 
                         player_stat[header] = value
 
@@ -155,44 +288,116 @@ class GeniusSportsParser:
                 total_row = tfoot.find("tr")
                 if total_row:
                     cells = total_row.find_all("td")
-                    for i, cell in enumerate(
-                        cells[2:], start=2
-                    ):  # Skip "Totals" and empty cells
-                        if i >= len(headers):
-                            break
-                        header = headers[i]
-                        value = cell.get_text(strip=True)
-                        # Try to convert to number
-                        try:
-                            if "." in value:
-                                value = float(value)
-                            else:
-                                value = int(value)
-                        except ValueError:
-                            pass
+                    # Skip "Totals" and empty cells; zip stops at the shorter
+                    for header, cell in zip(headers[2:], cells[2:]):
+                        value = _coerce(cell.get_text(strip=True))
                         team_data["totals"][header] = value
 
             # Get coaches
-            staff_div = table.find_next("div", class_="matchStaff")
             if staff_div:
                 staff_text = staff_div.get_text()
-                if "Head Coach:" in staff_text:
-                    head_coach = (
-                        staff_text.split("Head Coach:")[1].split("Coach:")[0].strip()
-                    )
-                    team_data["coaches"]["head_coach"] = head_coach
-                if "Coach:" in staff_text:
-                    assistant_coach = staff_text.split("Coach:")[-1].strip()
-                    team_data["coaches"]["assistant_coach"] = assistant_coach
+                coach_match = _COACH_RE.search(staff_text)
+                if coach_match:
+                    team_data["coaches"]["head_coach"] = coach_match.group(
+                        "head"
+                    ).strip()
+                    assistant = coach_match.group("asst")
+                    if assistant is not None:
+                        team_data["coaches"]["assistant_coach"] = assistant.strip()
+                else:
+                    assistant_match = _ASSISTANT_RE.search(staff_text)
+                    if assistant_match:
+                        team_data["coaches"]["assistant_coach"] = assistant_match.group(
+                            "asst"
+                        ).strip()
 
             if team_data["players"]:  # Only add if we found players
                 result["teams"].append(team_data)
 
         return result
 
+    @staticmethod
+    def parse_boxscore_html_columnar(
+        html_content: str | bytes,
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse box score player tables into column arrays instead of row dicts.
+
+        Each team is returned as ``{"team_name", "headers", "columns"}`` where
+        ``columns`` maps every header to a list with one entry per player row.
+        The column lists are ready for ``pd.DataFrame(team["columns"])`` or
+        ``np.asarray`` without any per-row key hashing downstream.
+
+        Args:
+            html_content: HTML content from the box score page
+
+        Returns:
+            List of per-team columnar dictionaries
+        """
+        soup = _soup(html_content, _BOXSCORE_STRAINER)
+
+        teams: List[Dict[str, Any]] = []
+        last_h4 = None
+        for element in soup.find_all(["h4", "table"]):
+            if element.name == "h4":
+                last_h4 = element
+                continue
+            if "tableClass" not in (element.get("class") or ()):
+                continue
+            table = element
+
+            headers = GeniusSportsParser._extract_headers(table)
+            player_columns = frozenset(
+                i for i, header in enumerate(headers) if "Player" in header
+            )
+            header_count = len(headers)
+            columns: Dict[str, List[Any]] = {header: [] for header in headers}
+            column_lists = [columns[header] for header in headers]
+
+            tbody = table.find("tbody")
+            if tbody is not None:
+                for row in tbody.find_all("tr"):
+                    cells = row.find_all("td", recursive=False)
+                    if len(cells) < header_count:
+                        continue
+                    for i, (header, cell, column) in enumerate(
+                        zip(headers, cells, column_lists)
+                    ):
+                        value = cell.get("data-sort-value")
+                        if value is None:
+                            if i in player_columns:
+                                link = cell.a
+                                value = (
+                                    link.get_text(strip=True)
+                                    if link
+                                    else cell.get_text(strip=True)
+                                )
+                            else:
+                                value = cell.get_text(strip=True)
+                                if header == "Shirt Number" or header == "No":
+                                    value = _coerce(value)
+                        else:
+                            value = _coerce(value)
+                        column.append(value)
+
+            if any(column_lists):
+                teams.append(
+                    {
+                        "team_name": (
+                            last_h4.get_text(strip=True)
+                            if last_h4 is not None
+                            else None
+                        ),
+                        "headers": headers,
+                        "columns": columns,
+                    }
+                )
+
+        return teams
+
     @staticmethod
     def parse_player_gamelog(
-        html_content: str, teams_dict: Dict[str, str]
+        html_content: str | bytes, teams_dict: Dict[str, str]
     ) -> Dict[str, Any]:
         """
         Parse player gamelog HTML content.
@@ -204,7 +409,7 @@ class GeniusSportsParser:
         Returns:
             Dictionary containing player's team and game statistics
         """
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = _soup(html_content)
 
         result: Dict[str, Any] = {
             "team": None,
@@ -214,23 +419,16 @@ class GeniusSportsParser:
 
         # Find the table with game logs
         table = soup.find("table", class_="tableClass")
-        if not table or isinstance(table, (NavigableString, int)):
+        if not isinstance(table, Tag):
             return result
 
         # Get column headers
-        headers = []
-        thead = table.find("thead")
-        if thead and isinstance(thead, Tag):
-            header_row = thead.find("tr")
-            if header_row and isinstance(header_row, Tag):
-                for th in header_row.find_all("th"):
-                    title = th.get("title", th.get_text(strip=True))
-                    headers.append(title)
+        headers = GeniusSportsParser._extract_headers(table)
 
         # Get game stats - try tbody first, then fall back to all tr elements
         tbody = table.find("tbody")
         rows: List[Any] = []
-        if tbody and isinstance(tbody, Tag):
+        if isinstance(tbody, Tag):
             rows = tbody.find_all("tr")
         else:
             # No tbody, get all tr elements and filter out the header row
@@ -240,29 +438,22 @@ class GeniusSportsParser:
                     rows.append(r)
 
         for row in rows:
-            if not isinstance(row, Tag):
-                continue
-
-            cells = row.find_all("td")
+            cells = row.find_all("td", recursive=False)
             if len(cells) < 2:
                 continue
 
             game_stat: Dict[str, Any] = {}
 
-            for i, cell in enumerate(cells):
-                if i >= len(headers):
-                    break
-
-                header = headers[i]
+            for header, cell in zip(headers, cells):
 
                 # Handle Team column - extract team name and ID
                 if header == "Team":
-                    link = cell.find("a")
-                    if link and isinstance(link, Tag):
+                    link = cell.a
+                    if link is not None:
                         team_name = link.get_text(strip=True)
                         href = link.get("href", "")
                         # Extract team ID from href
-                        team_match = re.search(r"/team/(\d+)", str(href))
+                        team_match = _TEAM_ID_RE.search(href)
                         if team_match:
                             team_id = team_match.group(1)
                             # Set player's team from first game
@@ -274,12 +465,12 @@ class GeniusSportsParser:
 
                 # Handle Date column - extract date and match link
                 if header == "Date":
-                    link = cell.find("a")
-                    if link and isinstance(link, Tag):
+                    link = cell.a
+                    if link is not None:
                         date_text = link.get_text(strip=True)
                         href = link.get("href", "")
                         # Extract match ID from href
-                        match_match = re.search(r"/match/(\d+)", str(href))
+                        match_match = _MATCH_ID_RE.search(href)
                         if match_match:
                             game_stat["Match ID"] = match_match.group(1)
                         game_stat[header] = date_text
@@ -290,18 +481,9 @@ class GeniusSportsParser:
                 # Get value from cell
                 value = cell.get_text(strip=True)
 
-                # Try to convert to appropriate type for numeric fields
+                # Convert to appropriate type for numeric fields
                 if header not in ["Team", "Date"]:
-                    try:
-                        # Check if it's a time format (MM:SS)
-                        if ":" in value:
-                            value = value  # Keep as string for time
-                        elif "." in value:
-                            value = float(value)
-                        else:
-                            value = int(value)
-                    except ValueError:
-                        pass  # Keep as string
+                    value = _coerce(value)
 
                 game_stat[header] = value
 
@@ -311,7 +493,27 @@ class GeniusSportsParser:
         return result
 
     @staticmethod
-    def parse_teams_page(html_content: str) -> List[Dict[str, Any]]:
+    def parse_player_gamelog_batch(
+        items: List[tuple], workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse many player gamelog pages in parallel across processes.
+
+        HTML parsing is CPU-bound and holds the GIL, so threads do not help;
+        a process pool scales with core count instead.
+
+        Args:
+            items: List of (html_content, teams_dict) tuples, one per page
+            workers: Number of worker processes (defaults to the core count)
+
+        Returns:
+            List of parsed gamelog dictionaries, in the same order as items
+        """
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_parse_gamelog_item, items, chunksize=8))
+
+    @staticmethod
+    def parse_teams_page(html_content: str | bytes) -> List[Dict[str, Any]]:
         """
         Parse teams page HTML and extract team data.
 
@@ -321,20 +523,21 @@ class GeniusSportsParser:
         Returns:
             List of dictionaries containing team data (id, name)
         """
-        soup = BeautifulSoup(html_content, "html.parser")
         teams = []
         seen_ids = set()
 
-        # Find all links with /team/ in href
-        all_links = soup.find_all("a", href=re.compile(r"/team/\d+"))
-        for link in all_links:
+        # Find all links with /team/ in href; the C-level substring test
+        # discards the many unrelated anchors before the regex ever runs
+        for link in _iter_links(html_content):
             href = link.get("href", "")
+            if "/team/" not in href:
+                continue
             # Extract team ID from href
             # Format: /FBAA/en/competition/42145/team/98486?
-            match = re.search(r"/team/(\d+)", str(href))
+            match = _TEAM_ID_RE.search(href)
             if match:
                 team_id = match.group(1)
-                team_name = link.get_text(strip=True)
+                team_name = _link_text(link)
 
                 # Avoid duplicates and empty names
                 if team_id not in seen_ids and team_name:
@@ -344,7 +547,7 @@ class GeniusSportsParser:
         return teams
 
     @staticmethod
-    def parse_players_page(html_content: str) -> List[Dict[str, Any]]:
+    def parse_players_page(html_content: str | bytes) -> List[Dict[str, Any]]:
         """
         Parse players page HTML and extract player links.
 
@@ -354,19 +557,19 @@ class GeniusSportsParser:
         Returns:
             List of dictionaries containing player data (id, name, href)
         """
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        # Find all player links
-        player_links_html = soup.find_all("a", class_="playername")
-
         player_links = []
-        for link in player_links_html:
+        for link in _iter_links(html_content):
+            # Single attribute fetch per anchor; the exact-match test covers
+            # the common single-class case without allocating a split list
+            classes = link.get("class") or ""
+            if classes != "playername" and "playername" not in classes.split():
+                continue
             href = link.get("href", "")
-            player_name = link.get_text(strip=True)
+            player_name = _link_text(link)
 
             # Extract player ID from href
             # Format: /FBAA/en/competition/42145/person/457315?
-            match = re.search(r"/person/(\d+)", href)
+            match = _PERSON_ID_RE.search(href)
             if match:
                 player_id = match.group(1)
                 if player_name:  # Only add if there's a name
@@ -377,7 +580,7 @@ class GeniusSportsParser:
         return player_links
 
     @staticmethod
-    def parse_team_roster_page(html_content: str) -> List[Dict[str, Any]]:
+    def parse_team_roster_page(html_content: str | bytes) -> List[Dict[str, Any]]:
         """
         Parse team roster page HTML and extract player links.
 
@@ -387,35 +590,31 @@ class GeniusSportsParser:
         Returns:
             List of dictionaries containing player data (id, name, href)
         """
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        # Find all player links on the team page
+        # Find all player links on the team page, deduplicating by player ID
+        # as they stream in
         # They should be in links that go to /person/
-        player_links = []
-        for link in soup.find_all("a", href=re.compile(r"/person/\d+")):
-            # Only get unique player links
+        seen_ids = set()
+        unique_players = []
+        for link in _iter_links(html_content):
             href = link.get("href", "")
-            match = re.search(r"/person/(\d+)", str(href))
+            if "/person/" not in href:
+                continue
+            match = _PERSON_ID_RE.search(href)
             if match:
                 player_id = match.group(1)
-                player_name = link.get_text(strip=True)
+                if player_id in seen_ids:
+                    continue
+                player_name = _link_text(link)
                 if player_name:  # Only add if there's a name
-                    player_links.append(
+                    seen_ids.add(player_id)
+                    unique_players.append(
                         {"id": player_id, "name": player_name, "href": href}
                     )
 
-        # Remove duplicates based on player ID
-        seen_ids = set()
-        unique_players = []
-        for player in player_links:
-            if player["id"] not in seen_ids:
-                seen_ids.add(player["id"])
-                unique_players.append(player)
-
         return unique_players
 
     @staticmethod
-    def parse_team_statistics_page(html_content: str) -> Dict[str, Any]:
+    def parse_team_statistics_page(html_content: str | bytes) -> Dict[str, Any]:
         """
         Parse team statistics page HTML and extract player statistics.
 
@@ -425,7 +624,7 @@ class GeniusSportsParser:
         Returns:
             Dictionary containing team info and three statistical categories
         """
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = _soup(html_content)
 
         result: Dict[str, Any] = {
             "team_name": None,
@@ -437,14 +636,14 @@ class GeniusSportsParser:
 
         # Extract team name
         team_title = soup.find("h1", class_="team-title")
-        if team_title and isinstance(team_title, Tag):
+        if team_title is not None:
             result["team_name"] = team_title.get_text(strip=True)
 
         # Extract team location from contact details
         contact_div = soup.find("h2", string="Contact Details")
         if contact_div and isinstance(contact_div, Tag):
             parent = contact_div.find_parent()
-            if parent and isinstance(parent, Tag):
+            if parent is not None:
                 # Get text after the h2, before any other tags
                 text_parts = []
                 for sibling in contact_div.next_siblings:
@@ -459,58 +658,60 @@ class GeniusSportsParser:
                 if text_parts:
                     result["team_location"] = text_parts[0]
 
-        # Find all statistical tables
-        tables = soup.find_all("table", class_="tableClass")
-
-        for table in tables:
-            # Find the preceding h4 to determine table type
-            h4 = table.find_previous("h4")
-            if not h4 or not isinstance(h4, Tag):
-                continue
-
+        # Pair each statistical table with its preceding h4 (the table type)
+        # in one linear pass instead of a find_previous walk per table
+        typed_tables = []
+        last_h4 = None
+        for element in soup.find_all(["h4", "table"]):
+            if element.name == "h4":
+                last_h4 = element
+            elif "tableClass" in (element.get("class") or ()) and last_h4 is not None:
+                typed_tables.append((last_h4, element))
+
+        for h4, table in typed_tables:
             table_type = h4.get_text(strip=True)
 
             # Get column headers
-            headers = []
-            thead = table.find("thead")
-            if thead and isinstance(thead, Tag):
-                header_row = thead.find("tr")
-                if header_row and isinstance(header_row, Tag):
-                    for th in header_row.find_all("th"):
-                        # Use title attribute if available, otherwise text
-                        header = th.get("title", th.get_text(strip=True))
-                        headers.append(header)
+            headers = GeniusSportsParser._extract_headers(table)
 
             # Get player stats
             tbody = table.find("tbody")
-            if not tbody or not isinstance(tbody, Tag):
+            if tbody is None:
                 continue
 
+            # Column index of the player link, resolved once per table
+            try:
+                player_col = headers.index("Player")
+            except ValueError:
+                player_col = -1
+
             players_stats = []
             for row in tbody.find_all("tr"):
-                if not isinstance(row, Tag):
-                    continue
-
-                cells = row.find_all("td")
+                cells = row.find_all("td", recursive=False)
                 if len(cells) < 2:
                     continue
 
-                player_stat: Dict[str, Any] = {}
+                # Materialize sort values and (where needed) cell texts once
+                # per row so each cell's descendants are walked at most once
+                sorts = [cell.get("data-sort-value") for cell in cells]
+                texts = [
+                    cell.get_text(strip=True) if sort is None else None
+                    for cell, sort in zip(cells, sorts)
+                ]
 
-                for i, cell in enumerate(cells):
-                    if i >= len(headers):
-                        break
-
-                    header = headers[i]
+                player_stat: Dict[str, Any] = {}
 
+                for i, (header, cell, sort_value, cell_text) in enumerate(
+                    zip(headers, cells, sorts, texts)
+                ):
                     # Handle Player column - extract name and ID
-                    if header == "Player":
-                        link = cell.find("a")
-                        if link and isinstance(link, Tag):
+                    if i == player_col:
+                        link = cell.a
+                        if link is not None:
                             player_name = link.get_text(strip=True)
                             href = link.get("href", "")
                             # Extract player ID from href
-                            match = re.search(r"/person/(\d+)", str(href))
+                            match = _PERSON_ID_RE.search(href)
                             if match:
                                 player_stat["player_id"] = match.group(1)
                             player_stat["player_name"] = player_name
@@ -518,31 +719,14 @@ class GeniusSportsParser:
 
                     # Get value from cell
                     # First try data-sort-value attribute
-                    value = cell.get("data-sort-value")
-                    if value is not None:
-                        # Try to convert to appropriate type
-                        try:
-                            if "." in str(value):
-                                value = float(value)
-                            else:
-                                value = int(value)
-                        except (ValueError, TypeError):
-                            pass  # Keep as string
+                    if sort_value is not None:
+                        value = _coerce(sort_value)
                     else:
                         # Get text content
-                        value = cell.get_text(strip=True)
-                        # Try to convert to number for numeric fields
+                        value = cell_text
+                        # Convert to number for numeric fields
                         if header not in ["Player"]:
-                            try:
-                                # Check if it's a time format (MM:SS)
-                                if ":" in str(value):
-                                    value = value  # Keep as string for time
-                                elif "." in str(value):
-                                    value = float(value)
-                                else:
-                                    value = int(value)
-                            except (ValueError, TypeError):
-                                pass  # Keep as string
+                            value = _coerce(cell_text or "")
 
                     player_stat[header] = value
 
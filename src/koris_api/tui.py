@@ -1,16 +1,196 @@
+import csv
 import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, cast
-import pandas as pd
+from typing import TYPE_CHECKING, Optional, cast
+import numpy as np
 import requests
+from textual import work
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, Button, Static, Select, DataTable
 from textual.containers import Container, Horizontal, VerticalScroll
 from textual.binding import Binding
 from textual.screen import Screen
+from textual.timer import Timer
+from ._cache import (
+    cached_get_match,
+    cached_get_matches,
+    cached_get_team,
+    invalidate_matches,
+)
 from .basketfi_api import BasketFiAPI
 from .genius_api import GeniusSportsAPI
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime (see load_team_matches); only annotations
+    # need the name
+    import pandas as pd
+
+# Decorative separators built once instead of on every render
+_SEP80 = "[bold cyan]" + "=" * 80 + "[/bold cyan]"
+_SEP60 = "[bold cyan]" + "=" * 60 + "[/bold cyan]"
+
+
+def _classify_results(
+    home_points: "pd.Series", away_points: "pd.Series", is_home: np.ndarray
+) -> np.ndarray:
+    """W/L/D classification for a whole match list in numpy.
+
+    Runs branch-free in C regardless of list size; rows whose scores did
+    not parse (NaN) come back as "-".
+    """
+    home_result = np.where(
+        home_points > away_points, "W", np.where(home_points < away_points, "L", "D")
+    )
+    away_result = np.where(
+        away_points > home_points, "W", np.where(away_points < home_points, "L", "D")
+    )
+    return np.where(
+        home_points.notna() & away_points.notna(),
+        np.where(is_home, home_result, away_result),
+        "-",
+    )
+
+
+def _pop_to_main(app: App) -> None:
+    """Pop every pushed screen inside one batched update.
+
+    Popping in a bare while loop repaints after every pop; batching keeps
+    deep navigation stacks to a single refresh.
+    """
+    with app.batch_update():
+        while len(app.screen_stack) > 1:
+            app.pop_screen()
+
+
+def _load_categories() -> dict:
+    """Load categories from JSON file"""
+    categories_path = Path(__file__).parent.parent.parent / "categories.json"
+    if categories_path.exists():
+        if orjson is not None:
+            return cast(dict, orjson.loads(categories_path.read_bytes()))
+        with open(categories_path) as f:
+            return cast(dict, json.load(f))
+    return {
+        "2": {"category_name": "Miesten I divisioona A"},
+        "4": {"category_name": "Korisliiga"},
+    }
+
+
+# Parsed once at import; every KorisApp instance shares the same mapping
+# instead of re-reading the file per construction
+_CATEGORIES = _load_categories()
+
+
+# Raw getMatches keys read by _normalize_match, pulled in one pass
+_EXTRACT = (
+    "match_id",
+    "date",
+    "time",
+    "club_A_name",
+    "team_A_name",
+    "team_A_id",
+    "club_B_name",
+    "team_B_name",
+    "team_B_id",
+    "fs_A",
+    "fs_B",
+    "status",
+    "venue_name",
+    "competition_name",
+    "category_name",
+)
+
+
+class _MatchRow:
+    """One normalized match: an exportable dict plus display-only extras.
+
+    Keeping is_played and the render tuple off the dict means saving can
+    write the dict as-is instead of copying every row to strip them.
+    """
+
+    __slots__ = ("data", "is_played", "row")
+
+    def __init__(self, data: dict, is_played: bool, row: tuple):
+        self.data = data
+        self.is_played = is_played
+        self.row = row
+
+
+def _normalize_match(match: dict, season: Optional[str]) -> "_MatchRow":
+    """Shape one raw getMatches entry into the row dict the app works with."""
+    # One C-level pass over a constant key tuple instead of fifteen
+    # scattered .get calls
+    get = match.get
+    (
+        match_id,
+        date,
+        time_str,
+        club_a,
+        team_a,
+        team_a_id,
+        club_b,
+        team_b,
+        team_b_id,
+        fs_a,
+        fs_b,
+        match_status,
+        venue,
+        competition,
+        category,
+    ) = [get(key) for key in _EXTRACT]
+
+    # Team A is home, Team B is away
+    home_team = club_a if club_a is not None else team_a if team_a is not None else "N/A"
+    away_team = club_b if club_b is not None else team_b if team_b is not None else "N/A"
+    # Show only HH:MM; slicing a string shorter than five characters
+    # returns it unchanged, so no length check is needed
+    time_str = "N/A" if time_str is None else time_str[:5]
+
+    # Get score - fs_A and fs_B are the final scores
+    home_score = fs_a or "-"
+    away_score = fs_b or "-"
+    if date is None:
+        date = "N/A"
+
+    return _MatchRow(
+        data={
+            "Match ID": match_id if match_id is not None else "",
+            "Date": date,
+            "Time": time_str,
+            "Home Team": home_team,
+            "Home Team ID": team_a_id if team_a_id is not None else "",
+            "Home Score": home_score,
+            "Away Score": away_score,
+            "Away Team": away_team,
+            "Away Team ID": team_b_id if team_b_id is not None else "",
+            "Status": match_status if match_status is not None else "Scheduled",
+            "Venue": venue if venue is not None else "N/A",
+            "Competition": competition if competition is not None else "N/A",
+            "Category": category if category is not None else "N/A",
+            "Season": season,
+        },
+        # Played matches have both final scores filled in
+        is_played=home_score != "-" and away_score != "-",
+        # Ready-to-render table row; none of these fields change after
+        # fetch, so the score string is formatted once here instead of on
+        # every filter toggle
+        row=(
+            home_team,
+            f"{home_score} - {away_score}",
+            away_team,
+            date,
+            time_str,
+        ),
+    )
+
 
 class MatchViewScreen(Screen):
     """Screen to display detailed match information."""
@@ -93,29 +273,52 @@ class MatchViewScreen(Screen):
 
     def on_mount(self) -> None:
         """Fetch and display match data when screen is mounted."""
+        # Resolve widget handles once; query_one walks the DOM on every call
+        self._info_display = self.query_one("#match_info_display", Static)
+        self._home_header = self.query_one("#home_team_header", Static)
+        self._home_table = self.query_one("#home_players_table", DataTable)
+        self._away_header = self.query_one("#away_team_header", Static)
+        self._away_table = self.query_one("#away_players_table", DataTable)
+        self._adv_header = self.query_one("#advanced_boxscore_header", Static)
+        self._adv_loading = self.query_one("#advanced_boxscore_loading", Static)
+        self._adv_home_header = self.query_one("#advanced_home_team_header", Static)
+        self._adv_home_table = self.query_one(
+            "#advanced_home_players_table", DataTable
+        )
+        self._adv_away_header = self.query_one("#advanced_away_team_header", Static)
+        self._adv_away_table = self.query_one(
+            "#advanced_away_players_table", DataTable
+        )
+        # The worker kicks off the advanced box score load once the match
+        # payload (and its Genius Sports ID) has arrived
         self.load_match_data()
-        # Start loading advanced box score in the background
-        self.load_advanced_boxscore()
 
+    @work(exclusive=False, thread=True)
     def load_match_data(self) -> None:
-        """Fetch and display match information."""
-        display = self.query_one("#match_info_display", Static)
+        """Fetch and display match information off the event loop thread."""
+        display = self._info_display
 
         try:
-            display.update("Loading match data...")
-            data = BasketFiAPI.get_match(self.match_id)
+            self.app.call_from_thread(display.update, "Loading match data...")
+            data = cached_get_match(self.match_id)
 
             if "match" in data:
                 self.match_data = data["match"]
                 # Extract Genius Sports match ID if available
                 if self.match_data and "match_external_id" in self.match_data:
                     self.boxscore_match_id = self.match_data["match_external_id"]
-                self.render_match_info()
+                self.app.call_from_thread(self.render_match_info)
+                # Start loading advanced box score in the background
+                self.app.call_from_thread(self.load_advanced_boxscore)
             else:
-                display.update(f"No data found for match {self.match_id}")
+                self.app.call_from_thread(
+                    display.update, f"No data found for match {self.match_id}"
+                )
 
         except Exception as e:
-            display.update(f"Error loading match data: {str(e)}")
+            self.app.call_from_thread(
+                display.update, f"Error loading match data: {str(e)}"
+            )
 
     def render_match_info(self) -> None:
         """Render the match information."""
@@ -124,56 +327,48 @@ class MatchViewScreen(Screen):
 
         match = self.match_data
 
-        # Build match info display
-        info_lines = []
-
-        # Header
-        info_lines.append(f"[bold cyan]{'=' * 80}[/bold cyan]")
-        info_lines.append(
-            f"[bold yellow]{match.get('club_A_name', 'N/A')} vs {match.get('club_B_name', 'N/A')}[/bold yellow]"
-        )
-        info_lines.append(f"[bold cyan]{'=' * 80}[/bold cyan]\n")
-
-        # Match Details
-        info_lines.append("[bold green]MATCH INFORMATION[/bold green]")
-        info_lines.append(
-            f"Date: {match.get('date', 'N/A')} at {match.get('time', 'N/A')}"
-        )
-        info_lines.append(
-            f"Venue: {match.get('venue_name', 'N/A')}, {match.get('venue_city', 'N/A')}"
-        )
-        info_lines.append(f"Competition: {match.get('competition_name', 'N/A')}")
-        info_lines.append(f"Category: {match.get('category_name', 'N/A')}")
-        info_lines.append(f"Status: {match.get('status', 'N/A')}")
-
-        # Score
+        # Optional score block with quarter breakdown
+        score_block = ""
         if match.get("fs_A") and match.get("fs_B"):
-            info_lines.append(
-                f"\n[bold]Final Score: {match.get('fs_A')} - {match.get('fs_B')}[/bold]"
+            score_block = (
+                f"\n\n[bold]Final Score: "
+                f"{match.get('fs_A')} - {match.get('fs_B')}[/bold]"
             )
-
-            # Quarter scores if available
             quarters = []
             for i in range(1, 5):
                 q_a = match.get(f"q{i}_A")
                 q_b = match.get(f"q{i}_B")
                 if q_a and q_b:
                     quarters.append(f"Q{i}: {q_a}-{q_b}")
-
             if quarters:
-                info_lines.append(f"Quarters: {' | '.join(quarters)}")
-
-        # Referees
-        if "referees" in match and match["referees"]:
-            info_lines.append("\n[bold green]REFEREES[/bold green]")
-            for ref in match["referees"]:
-                name = f"{ref.get('first_name', '')} {ref.get('last_name', '')}".strip()
-                role = ref.get("referee_role", "Referee")
-                info_lines.append(f"  {role}: {name}")
-
-        # Update the display
-        display = self.query_one("#match_info_display", Static)
-        display.update("\n".join(info_lines))
+                score_block += f"\nQuarters: {' | '.join(quarters)}"
+
+        # Optional referee block
+        referee_block = ""
+        if match.get("referees"):
+            referee_lines = "\n".join(
+                "  {}: {}".format(
+                    ref.get("referee_role", "Referee"),
+                    f"{ref.get('first_name', '')} {ref.get('last_name', '')}".strip(),
+                )
+                for ref in match["referees"]
+            )
+            referee_block = f"\n\n[bold green]REFEREES[/bold green]\n{referee_lines}"
+
+        # One string build and one Static.update instead of 20+ list appends
+        self._info_display.update(
+            f"{_SEP80}\n"
+            f"[bold yellow]{match.get('club_A_name', 'N/A')} vs "
+            f"{match.get('club_B_name', 'N/A')}[/bold yellow]\n"
+            f"{_SEP80}\n\n"
+            "[bold green]MATCH INFORMATION[/bold green]\n"
+            f"Date: {match.get('date', 'N/A')} at {match.get('time', 'N/A')}\n"
+            f"Venue: {match.get('venue_name', 'N/A')}, {match.get('venue_city', 'N/A')}\n"
+            f"Competition: {match.get('competition_name', 'N/A')}\n"
+            f"Category: {match.get('category_name', 'N/A')}\n"
+            f"Status: {match.get('status', 'N/A')}"
+            f"{score_block}{referee_block}"
+        )
 
         # Render player stats tables
         self.render_player_stats()
@@ -185,113 +380,86 @@ class MatchViewScreen(Screen):
 
         match = self.match_data
 
-        # Get lineups (player stats)
-        lineups = match.get("lineups", [])
-
-        # Separate by team
-        team_a_players = [
-            p for p in lineups if p.get("team_id") == match.get("team_A_id")
-        ]
-        team_b_players = [
-            p for p in lineups if p.get("team_id") == match.get("team_B_id")
-        ]
+        # Bucket the lineup by team in one pass instead of filtering it once
+        # per team with separate comprehensions
+        buckets: dict = defaultdict(list)
+        for player in match.get("lineups", []):
+            buckets[player.get("team_id")].append(player)
+
+        self._populate_player_table(
+            self._home_table,
+            self._home_header,
+            match.get("club_A_name", "Home Team"),
+            buckets.get(match.get("team_A_id"), []),
+        )
+        self._populate_player_table(
+            self._away_table,
+            self._away_header,
+            match.get("club_B_name", "Away Team"),
+            buckets.get(match.get("team_B_id"), []),
+        )
 
-        # Home team players (Team A)
-        home_table = self.query_one("#home_players_table", DataTable)
-        home_table.clear(columns=True)
+    @staticmethod
+    def _populate_player_table(
+        table: DataTable, header: Static, club_name: str, players: list
+    ) -> None:
+        """Fill one team's player-stats table; shared by home and away."""
+        table.clear(columns=True)
 
         # Add columns with fixed widths for consistency
-        home_table.add_column("#", width=5)
-        home_table.add_column("Player", width=25)
-        home_table.add_column("PTS", width=6)
-        home_table.add_column("FG", width=6)
-        home_table.add_column("3PT", width=6)
-        home_table.add_column("FT", width=6)
-        home_table.add_column("AST", width=6)
-        home_table.add_column("BLK", width=6)
-        home_table.add_column("FOUL", width=6)
-        home_table.add_column("MIN", width=6)
-
-        if team_a_players:
-            home_table.show_header = True
-            home_table.zebra_stripes = True
-            home_table.cursor_type = "none"
-
-            # Add title
-            home_header = self.query_one("#home_team_header", Static)
-            home_header.update(
-                f"\n[bold cyan]{match.get('club_A_name', 'Home Team')} - Player Statistics[/bold cyan]"
-            )
-
-            for player in sorted(
-                team_a_players, key=lambda p: int(p.get("pos_id", "999"))
-            ):
-                home_table.add_row(
-                    player.get("shirt_number", "-"),
-                    player.get("player_name", "Unknown"),
-                    str(player.get("points", "0")),
-                    str(player.get("goals", "0")),  # Field goals made
-                    str(player.get("goals", "0")),  # 3-pointers (same as goals for now)
-                    str(
-                        player.get("goals", "0")
-                    ),  # Free throws (same as goals for now)
-                    str(player.get("assists", "0")),
-                    str(player.get("blocks", "0")),
-                    str(player.get("fouls", "0")),
-                    str(player.get("playing_time_min", "0")),
-                )
-
-        # Away team players (Team B)
-        away_table = self.query_one("#away_players_table", DataTable)
-        away_table.clear(columns=True)
+        table.add_column("#", width=5)
+        table.add_column("Player", width=25)
+        table.add_column("PTS", width=6)
+        table.add_column("FG", width=6)
+        table.add_column("3PT", width=6)
+        table.add_column("FT", width=6)
+        table.add_column("AST", width=6)
+        table.add_column("BLK", width=6)
+        table.add_column("FOUL", width=6)
+        table.add_column("MIN", width=6)
+
+        if not players:
+            return
 
-        # Add columns with same fixed widths for consistency
-        away_table.add_column("#", width=5)
-        away_table.add_column("Player", width=25)
-        away_table.add_column("PTS", width=6)
-        away_table.add_column("FG", width=6)
-        away_table.add_column("3PT", width=6)
-        away_table.add_column("FT", width=6)
-        away_table.add_column("AST", width=6)
-        away_table.add_column("BLK", width=6)
-        away_table.add_column("FOUL", width=6)
-        away_table.add_column("MIN", width=6)
+        table.show_header = True
+        table.zebra_stripes = True
+        table.cursor_type = "none"
 
-        if team_b_players:
-            away_table.show_header = True
-            away_table.zebra_stripes = True
-            away_table.cursor_type = "none"
+        header.update(f"\n[bold cyan]{club_name} - Player Statistics[/bold cyan]")
 
-            # Add title for away team
-            away_header = self.query_one("#away_team_header", Static)
-            away_header.update(
-                f"\n[bold cyan]{match.get('club_B_name', 'Away Team')} - Player Statistics[/bold cyan]"
-            )
+        # Decorate-sort-undecorate: pos_id is fetched and parsed once per
+        # player instead of on every comparison
+        decorated = [(int(p.get("pos_id") or 999), p) for p in players]
+        decorated.sort(key=itemgetter(0))
 
-            for player in sorted(
-                team_b_players, key=lambda p: int(p.get("pos_id", "999"))
-            ):
-                away_table.add_row(
+        # One add_rows call means one reflow instead of one per player
+        rows = []
+        for _, player in decorated:
+            goals = str(player.get("goals", "0"))
+            rows.append(
+                (
                     player.get("shirt_number", "-"),
                     player.get("player_name", "Unknown"),
                     str(player.get("points", "0")),
-                    str(player.get("goals", "0")),
-                    str(player.get("goals", "0")),
-                    str(player.get("goals", "0")),
+                    goals,  # Field goals made
+                    goals,  # 3-pointers (same as goals for now)
+                    goals,  # Free throws (same as goals for now)
                     str(player.get("assists", "0")),
                     str(player.get("blocks", "0")),
                     str(player.get("fouls", "0")),
                     str(player.get("playing_time_min", "0")),
                 )
+            )
+        table.add_rows(rows)
 
     def load_advanced_boxscore(self) -> None:
         """Load advanced box score data in the background using a worker."""
         # Show loading indicator
-        loading = self.query_one("#advanced_boxscore_loading", Static)
-        header = self.query_one("#advanced_boxscore_header", Static)
+        loading = self._adv_loading
+        header = self._adv_header
 
         header.update(
-            "\n[bold cyan]{'=' * 80}[/bold cyan]\n[bold yellow]ADVANCED BOX SCORE (Genius Sports)[/bold yellow]\n[bold cyan]{'=' * 80}[/bold cyan]"
+            f"\n{_SEP80}\n[bold yellow]ADVANCED BOX SCORE (Genius Sports)[/bold yellow]\n{_SEP80}"
         )
         loading.update("[dim]Loading advanced statistics...[/dim]")
 
@@ -327,8 +495,7 @@ class MatchViewScreen(Screen):
 
     def _update_boxscore_error(self, error_msg: str) -> None:
         """Update the UI when box score loading fails."""
-        loading = self.query_one("#advanced_boxscore_loading", Static)
-        loading.update(
+        self._adv_loading.update(
             f"[dim red]Advanced statistics not available: {error_msg}[/dim red]"
         )
 
@@ -337,8 +504,7 @@ class MatchViewScreen(Screen):
         self.boxscore_data = boxscore_data
 
         # Clear loading message
-        loading = self.query_one("#advanced_boxscore_loading", Static)
-        loading.update("")
+        self._adv_loading.update("")
 
         # Render the advanced box score
         self.render_advanced_boxscore()
@@ -354,12 +520,12 @@ class MatchViewScreen(Screen):
 
         # Render home team (first team in the list)
         home_team = teams[0]
-        home_header = self.query_one("#advanced_home_team_header", Static)
+        home_header = self._adv_home_header
         home_header.update(
             f"\n[bold cyan]{home_team.get('team_name', 'Home Team')} - Advanced Statistics[/bold cyan]"
         )
 
-        home_table = self.query_one("#advanced_home_players_table", DataTable)
+        home_table = self._adv_home_table
         home_table.clear(columns=True)
 
         # Add columns for advanced stats
@@ -444,12 +610,12 @@ class MatchViewScreen(Screen):
 
         # Render away team (second team in the list)
         away_team = teams[1]
-        away_header = self.query_one("#advanced_away_team_header", Static)
+        away_header = self._adv_away_header
         away_header.update(
             f"\n[bold cyan]{away_team.get('team_name', 'Away Team')} - Advanced Statistics[/bold cyan]"
         )
 
-        away_table = self.query_one("#advanced_away_players_table", DataTable)
+        away_table = self._adv_away_table
         away_table.clear(columns=True)
 
         # Add columns for advanced stats (same as home)
@@ -538,8 +704,7 @@ class MatchViewScreen(Screen):
             self.app.pop_screen()
         elif event.button.id == "btn_back_to_matches":
             # Pop all screens until we're back at the main screen
-            while len(self.app.screen_stack) > 1:
-                self.app.pop_screen()
+            _pop_to_main(self.app)
 
     def action_back(self) -> None:
         """Go back to the main screen."""
@@ -597,6 +762,7 @@ class TeamViewScreen(Screen):
         self.season = season
         self.team_data = None
         self.team_matches: list = []
+        self._prefetch_timer: Optional[Timer] = None
 
     def compose(self) -> ComposeResult:
         """Create the team view layout."""
@@ -615,25 +781,37 @@ class TeamViewScreen(Screen):
 
     def on_mount(self) -> None:
         """Fetch and display team data when screen is mounted."""
+        # Resolve widget handles once; query_one walks the DOM on every call
+        self._info_display = self.query_one("#team_info_display", Static)
+        self._players_table = self.query_one("#players_table", DataTable)
+        self._matches_header = self.query_one("#matches_header", Static)
+        self._matches_table = self.query_one("#team_matches_table", DataTable)
+        # Both workers run on their own threads so the team-info and
+        # team-matches requests go out concurrently
         self.load_team_data()
         self.load_team_matches()
 
+    @work(exclusive=False, thread=True)
     def load_team_data(self) -> None:
-        """Fetch and display team information."""
-        display = self.query_one("#team_info_display", Static)
+        """Fetch and display team information off the event loop thread."""
+        display = self._info_display
 
         try:
-            display.update("Loading team data...")
-            data = BasketFiAPI.get_team(self.team_id)
+            self.app.call_from_thread(display.update, "Loading team data...")
+            data = cached_get_team(self.team_id)
 
             if "team" in data:
                 self.team_data = data["team"]
-                self.render_team_info()
+                self.app.call_from_thread(self.render_team_info)
             else:
-                display.update(f"No data found for {self.team_name}")
+                self.app.call_from_thread(
+                    display.update, f"No data found for {self.team_name}"
+                )
 
         except Exception as e:
-            display.update(f"Error loading team data: {str(e)}")
+            self.app.call_from_thread(
+                display.update, f"Error loading team data: {str(e)}"
+            )
 
     def render_team_info(self) -> None:
         """Render the team information."""
@@ -642,65 +820,72 @@ class TeamViewScreen(Screen):
 
         team = self.team_data
 
-        # Build comprehensive team info display
-        info_sections = []
-
-        # Header
-        info_sections.append(f"[bold cyan]{'=' * 60}[/bold cyan]")
-        info_sections.append(
-            f"[bold yellow]{team.get('team_name', 'N/A')}[/bold yellow]"
-        )
-        info_sections.append(f"[bold cyan]{'=' * 60}[/bold cyan]\n")
-
-        # Add season note if viewing a specific season
+        # Optional season note
+        season_block = ""
         if self.season:
-            info_sections.append(f"[italic]Viewing season: {self.season}[/italic]")
-            info_sections.append(
-                "[italic dim]Note: Team roster and info shows current data, matches are filtered by season[/italic dim]\n"
+            season_block = (
+                f"[italic]Viewing season: {self.season}[/italic]\n"
+                "[italic dim]Note: Team roster and info shows current data, "
+                "matches are filtered by season[/italic dim]\n\n"
             )
 
-        # Basic Info Section
-        info_sections.append("[bold green]TEAM INFORMATION[/bold green]")
-        info_sections.append(f"Club: {team.get('club_name', 'N/A')}")
-        info_sections.append(f"Abbreviation: {team.get('club_abbrevation', 'N/A')}")
-        info_sections.append(f"City: {team.get('club_city_name', 'N/A')}")
-        info_sections.append(f"Home Venue: {team.get('home_venue_name', 'N/A')}")
-        info_sections.append(f"Gender: {team.get('gender_fi', 'N/A')}")
-
-        if team.get("club_www"):
-            info_sections.append(f"Website: {team.get('club_www')}")
-
-        info_sections.append("")
+        website_line = (
+            f"Website: {team.get('club_www')}\n" if team.get("club_www") else ""
+        )
 
-        # Primary Category
+        # Optional current competition block
+        category_block = ""
         if "primary_category" in team:
             cat = team["primary_category"]
-            info_sections.append("[bold green]CURRENT COMPETITION[/bold green]")
-            info_sections.append(f"Category: {cat.get('category_name', 'N/A')}")
-            info_sections.append(f"Competition: {cat.get('competition_name', 'N/A')}")
-            info_sections.append("")
-
-        # Coaching Staff
-        if "officials" in team and team["officials"]:
-            info_sections.append("[bold green]COACHING STAFF[/bold green]")
-            for official in team["officials"]:
-                role = official.get("official_role", "Coach")
-                name = f"{official.get('first_name', '')} {official.get('last_name', '')}".strip()
-                info_sections.append(f"  {role}: {name}")
-            info_sections.append("")
-
-        # Update the display
-        display = self.query_one("#team_info_display", Static)
-        display.update("\n".join(info_sections))
+            category_block = (
+                "[bold green]CURRENT COMPETITION[/bold green]\n"
+                f"Category: {cat.get('category_name', 'N/A')}\n"
+                f"Competition: {cat.get('competition_name', 'N/A')}\n\n"
+            )
 
-        # Render players in DataTable
-        if "players" in team and team["players"]:
-            info_sections.append(
-                f"\n[bold green]PLAYERS ({team.get('players_count', len(team['players']))})[/bold green]"
+        # Optional coaching staff block
+        staff_block = ""
+        if team.get("officials"):
+            staff_lines = "\n".join(
+                "  {}: {}".format(
+                    official.get("official_role", "Coach"),
+                    f"{official.get('first_name', '')} "
+                    f"{official.get('last_name', '')}".strip(),
+                )
+                for official in team["officials"]
             )
-            display.update("\n".join(info_sections))
+            staff_block = f"[bold green]COACHING STAFF[/bold green]\n{staff_lines}\n\n"
+
+        players = team.get("players") or []
+        players_line = (
+            f"\n[bold green]PLAYERS "
+            f"({team.get('players_count', len(players))})[/bold green]"
+            if players
+            else ""
+        )
+
+        # One string build and a single Static.update; the old section list
+        # updated the display twice per render
+        self._info_display.update(
+            f"{_SEP60}\n"
+            f"[bold yellow]{team.get('team_name', 'N/A')}[/bold yellow]\n"
+            f"{_SEP60}\n\n"
+            f"{season_block}"
+            "[bold green]TEAM INFORMATION[/bold green]\n"
+            f"Club: {team.get('club_name', 'N/A')}\n"
+            f"Abbreviation: {team.get('club_abbrevation', 'N/A')}\n"
+            f"City: {team.get('club_city_name', 'N/A')}\n"
+            f"Home Venue: {team.get('home_venue_name', 'N/A')}\n"
+            f"Gender: {team.get('gender_fi', 'N/A')}\n"
+            f"{website_line}\n"
+            f"{category_block}"
+            f"{staff_block}"
+            f"{players_line}"
+        )
 
-            players_table = self.query_one("#players_table", DataTable)
+        # Render players in DataTable
+        if players:
+            players_table = self._players_table
             players_table.clear(columns=True)
             players_table.add_columns(
                 "#", "Name", "Position", "Height", "Birth Year", "Nationality"
@@ -709,12 +894,19 @@ class TeamViewScreen(Screen):
             players_table.zebra_stripes = True
             players_table.cursor_type = "none"
 
-            for player in sorted(
-                team["players"],
-                key=lambda p: int(p.get("shirt_number", "999"))
-                if p.get("shirt_number", "").isdigit()
-                else 999,
-            ):
+            # Decorate-sort-undecorate: each shirt number is fetched and
+            # parsed once instead of on every comparison
+            decorated = [
+                (
+                    int(number)
+                    if (number := p.get("shirt_number", "")).isdigit()
+                    else 999,
+                    p,
+                )
+                for p in players
+            ]
+            decorated.sort(key=itemgetter(0))
+            for _, player in decorated:
                 number = player.get("shirt_number", "-")
                 name = f"{player.get('first_name', '')} {player.get('last_name', '')}".strip()
                 position = player.get("position_fi", "-")
@@ -726,103 +918,115 @@ class TeamViewScreen(Screen):
                     number, name, position, height, birthyear, nationality
                 )
 
+    @work(exclusive=False, thread=True)
     def load_team_matches(self) -> None:
-        """Fetch and display team matches."""
-        if not self.team_data:
-            matches_header = self.query_one("#matches_header", Static)
-            matches_header.update(
-                "\n[bold red]TEAM MATCHES[/bold red] - No team data available"
-            )
-            return
+        """Fetch and display team matches off the event loop thread."""
+        matches_header = self._matches_header
 
         try:
-            # Fetch matches directly by team_id
-            matches_data = BasketFiAPI.get_matches(team_id=str(self.team_id))
+            # Fetch matches directly by team_id; this only needs the team id,
+            # so it can run concurrently with load_team_data
+            matches_data = cached_get_matches(team_id=str(self.team_id))
 
             if "matches" not in matches_data:
-                matches_header = self.query_one("#matches_header", Static)
-                matches_header.update(
-                    "\n[bold yellow]TEAM MATCHES[/bold yellow] - No matches found in response"
+                self.app.call_from_thread(
+                    matches_header.update,
+                    "\n[bold yellow]TEAM MATCHES[/bold yellow] - No matches found in response",
                 )
                 return
 
             if len(matches_data["matches"]) == 0:
-                matches_header = self.query_one("#matches_header", Static)
-                matches_header.update(
-                    "\n[bold yellow]TEAM MATCHES[/bold yellow] - No games found for this team"
+                self.app.call_from_thread(
+                    matches_header.update,
+                    "\n[bold yellow]TEAM MATCHES[/bold yellow] - No games found for this team",
                 )
                 return
 
-            # Process matches
-            self.team_matches = []
-            for match in matches_data["matches"]:
-                # Filter by season if specified
-                if self.season and match.get("season_id") != self.season:
-                    continue
-
-                # Determine if this team is home or away
-                is_home = match.get("team_A_id") == self.team_id
-
-                home_team = match.get("club_A_name", "N/A")
-                away_team = match.get("club_B_name", "N/A")
-                home_score = match.get("fs_A", "")
-                away_score = match.get("fs_B", "")
-
-                # Handle empty or missing scores
-                if not home_score or home_score == "":
-                    home_score = "-"
-                if not away_score or away_score == "":
-                    away_score = "-"
-
-                # Determine result
-                result = "-"
-                if home_score != "-" and away_score != "-":
-                    try:
-                        home_score_int = int(home_score)
-                        away_score_int = int(away_score)
-
-                        if is_home:
-                            if home_score_int > away_score_int:
-                                result = "W"
-                            elif home_score_int < away_score_int:
-                                result = "L"
-                            else:
-                                result = "D"
-                        else:
-                            if away_score_int > home_score_int:
-                                result = "W"
-                            elif away_score_int < home_score_int:
-                                result = "L"
-                            else:
-                                result = "D"
-                    except ValueError:
-                        # If score can't be converted to int, leave result as "-"
-                        pass
-
-                self.team_matches.append(
-                    {
-                        "date": match.get("date", "N/A"),
-                        "time": match.get("time", "N/A")[:5]
-                        if match.get("time")
-                        else "N/A",
-                        "opponent": away_team if is_home else home_team,
-                        "opponent_id": match.get("team_B_id")
-                        if is_home
-                        else match.get("team_A_id"),
-                        "venue": "Home" if is_home else "Away",
-                        "score": f"{home_score} - {away_score}",
-                        "result": result,
-                        "match_id": match.get("match_id"),
-                        "is_played": home_score != "-" and away_score != "-",
-                    }
+            # Process matches with vectorized pandas column ops instead of a
+            # per-match Python loop; for long seasons this runs the filter,
+            # score parsing and W/L/D branching in C. Imported here so TUI
+            # startup does not pay the pandas import; the first team view
+            # absorbs it on this worker thread.
+            import pandas as pd
+
+            df = pd.DataFrame(matches_data["matches"])
+
+            # Filter by season up front so the column ops below only touch
+            # kept rows
+            if self.season:
+                if "season_id" in df.columns:
+                    df = df[df["season_id"] == self.season]
+                else:
+                    df = df.iloc[0:0]
+
+            if df.empty:
+                self.team_matches = []
+                season_msg = f" for season {self.season}" if self.season else ""
+                self.app.call_from_thread(
+                    matches_header.update,
+                    f"\n[bold yellow]TEAM MATCHES[/bold yellow] - No games found{season_msg}",
                 )
+                return
+
+            def col(name: str, default: str = "") -> pd.Series:
+                if name in df.columns:
+                    return df[name]
+                return pd.Series(default, index=df.index, dtype=object)
+
+            # Determine if this team is home or away
+            is_home = (col("team_A_id") == self.team_id).to_numpy()
+
+            home_team = col("club_A_name", "N/A")
+            away_team = col("club_B_name", "N/A")
+
+            # Handle empty or missing scores
+            home_score = col("fs_A").astype(object)
+            away_score = col("fs_B").astype(object)
+            home_score = home_score.where(
+                home_score.notna() & (home_score != ""), "-"
+            )
+            away_score = away_score.where(
+                away_score.notna() & (away_score != ""), "-"
+            )
+
+            # Determine result; rows whose scores don't parse keep "-"
+            result = _classify_results(
+                pd.to_numeric(home_score, errors="coerce"),
+                pd.to_numeric(away_score, errors="coerce"),
+                is_home,
+            )
+
+            time_col = col("time")
+            time_str = np.where(
+                time_col.notna() & (time_col != ""),
+                time_col.astype(str).str[:5],
+                "N/A",
+            )
+
+            self.team_matches = pd.DataFrame(
+                {
+                    "date": col("date", "N/A"),
+                    "time": time_str,
+                    "opponent": np.where(is_home, away_team, home_team),
+                    "opponent_id": np.where(
+                        is_home, col("team_B_id"), col("team_A_id")
+                    ),
+                    "venue": np.where(is_home, "Home", "Away"),
+                    "score": home_score.astype(str) + " - " + away_score.astype(str),
+                    "result": result,
+                    "match_id": col("match_id"),
+                    "is_played": ((home_score != "-") & (away_score != "-")).astype(
+                        bool
+                    ),
+                }
+            ).to_dict("records")
 
             # Check if any matches were found after filtering
             if len(self.team_matches) == 0:
-                matches_header = self.query_one("#matches_header", Static)
                 season_msg = f" for season {self.season}" if self.season else ""
-                matches_header.update(
-                    f"\n[bold yellow]TEAM MATCHES[/bold yellow] - No games found{season_msg}"
+                self.app.call_from_thread(
+                    matches_header.update,
+                    f"\n[bold yellow]TEAM MATCHES[/bold yellow] - No games found{season_msg}",
                 )
                 return
 
@@ -830,30 +1034,29 @@ class TeamViewScreen(Screen):
             self.team_matches.sort(key=lambda m: m["date"])
 
             # Render the matches
-            self.render_team_matches()
+            self.app.call_from_thread(self.render_team_matches)
 
         except requests.exceptions.HTTPError as e:
-            matches_header = self.query_one("#matches_header", Static)
             status_code = e.response.status_code if e.response else "unknown"
-            matches_header.update(
-                f"\n[bold red]TEAM MATCHES[/bold red] - HTTP Error {status_code}: {str(e)}"
+            self.app.call_from_thread(
+                matches_header.update,
+                f"\n[bold red]TEAM MATCHES[/bold red] - HTTP Error {status_code}: {str(e)}",
             )
         except Exception as e:
-            matches_header = self.query_one("#matches_header", Static)
-            matches_header.update(
-                f"\n[bold red]TEAM MATCHES[/bold red] - Error: {str(e)}"
+            self.app.call_from_thread(
+                matches_header.update,
+                f"\n[bold red]TEAM MATCHES[/bold red] - Error: {str(e)}",
             )
 
     def render_team_matches(self) -> None:
         """Render team matches in a DataTable."""
         if not self.team_matches:
-            matches_header = self.query_one("#matches_header", Static)
-            matches_header.update(
+            self._matches_header.update(
                 "\n[bold green]TEAM MATCHES[/bold green] - No matches found"
             )
             return
 
-        matches_table = self.query_one("#team_matches_table", DataTable)
+        matches_table = self._matches_table
         matches_table.clear(columns=True)
         matches_table.add_columns(
             "Date", "Time", "Opponent", "Venue", "Score", "Result"
@@ -862,8 +1065,9 @@ class TeamViewScreen(Screen):
         matches_table.zebra_stripes = True
         matches_table.cursor_type = "cell"
 
-        for match in self.team_matches:
-            matches_table.add_row(
+        # Batch the rows so the table lays out once
+        matches_table.add_rows(
+            (
                 match["date"],
                 match["time"],
                 match["opponent"],
@@ -871,9 +1075,11 @@ class TeamViewScreen(Screen):
                 match["score"],
                 match["result"],
             )
+            for match in self.team_matches
+        )
 
         # Update header with count
-        matches_header = self.query_one("#matches_header", Static)
+        matches_header = self._matches_header
         played_count = sum(1 for m in self.team_matches if m["is_played"])
         total_count = len(self.team_matches)
         season_msg = f" ({self.season})" if self.season else ""
@@ -887,8 +1093,22 @@ class TeamViewScreen(Screen):
             self.app.pop_screen()
         elif event.button.id == "btn_back_to_matches":
             # Pop all screens until we're back at the main screen
-            while len(self.app.screen_stack) > 1:
-                self.app.pop_screen()
+            _pop_to_main(self.app)
+
+    def _open_match_view(self, match: dict) -> None:
+        """Push a MatchViewScreen for a played match with a known id."""
+        if not match["is_played"] or not match.get("match_id"):
+            return
+
+        # Determine home and away team names based on venue
+        if match["venue"] == "Home":
+            home_team, away_team = self.team_name, match["opponent"]
+        else:
+            home_team, away_team = match["opponent"], self.team_name
+
+        self.app.push_screen(
+            MatchViewScreen(str(match["match_id"]), home_team, away_team)
+        )
 
     def on_data_table_cell_selected(self, event: DataTable.CellSelected) -> None:
         """Handle cell selection in the team matches table."""
@@ -912,24 +1132,7 @@ class TeamViewScreen(Screen):
         # Columns: "Date"(0), "Time"(1), "Opponent"(2), "Venue"(3), "Score"(4), "Result"(5)
 
         if col_index == 0:  # Date - show match view for played matches
-            if match["is_played"]:
-                match_id = match.get("match_id")
-                if match_id:
-                    # Determine home and away team names based on venue
-                    if match["venue"] == "Home":
-                        home_team = self.team_name
-                        away_team = match["opponent"]
-                    else:
-                        home_team = match["opponent"]
-                        away_team = self.team_name
-
-                    self.app.push_screen(
-                        MatchViewScreen(
-                            str(match_id),
-                            home_team,
-                            away_team,
-                        )
-                    )
+            self._open_match_view(match)
 
         elif col_index == 2:  # Opponent - navigate to opponent team view
             opponent_id = match.get("opponent_id")
@@ -940,24 +1143,35 @@ class TeamViewScreen(Screen):
                 )
 
         elif col_index == 4:  # Score - show match view for played matches
-            if match["is_played"]:
-                match_id = match.get("match_id")
-                if match_id:
-                    # Determine home and away team names based on venue
-                    if match["venue"] == "Home":
-                        home_team = self.team_name
-                        away_team = match["opponent"]
-                    else:
-                        home_team = match["opponent"]
-                        away_team = self.team_name
-
-                    self.app.push_screen(
-                        MatchViewScreen(
-                            str(match_id),
-                            home_team,
-                            away_team,
-                        )
-                    )
+            self._open_match_view(match)
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Prefetch match details when the cursor settles on a played match."""
+        if event.data_table.id != "team_matches_table":
+            return
+
+        row_index = event.cursor_row
+        if row_index is None or row_index >= len(self.team_matches):
+            return
+
+        match = self.team_matches[row_index]
+        if not match["is_played"] or not match.get("match_id"):
+            return
+
+        # Debounce so arrowing through the list only fetches the row the
+        # cursor stops on; the worker just warms the TTL cache, so a later
+        # click gets a memory hit instead of the full round trip
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+        match_id = str(match["match_id"])
+        self._prefetch_timer = self.set_timer(
+            0.15,
+            lambda: self.run_worker(
+                lambda: cached_get_match(match_id),
+                thread=True,
+                exclusive=False,
+            ),
+        )
 
     def action_back(self) -> None:
         """Go back to the main screen."""
@@ -1020,41 +1234,39 @@ class KorisApp(App):
 
     def __init__(self):
         super().__init__()
-        self.categories = self.load_categories()
+        self.categories = _CATEGORIES
+        # compose can run more than once; build the Select options one time
+        self._category_options = [
+            (f"{cat_id}: {cat_data['category_name']}", cat_id)
+            for cat_id, cat_data in self.categories.items()
+        ]
         self.current_category = "2"
         self.current_competition_id = "huki2526"
         self.current_data = None
         self.seasons = {}  # Will be populated when category data is fetched
+        self._seasons_cache = {}  # category_id -> getCategory response
         self.current_season = None
         self.save_format = "json"  # Default save format
         self.matches_data = []  # Store matches for saving
+        self.displayed_matches = []  # Filtered view currently in the table
+        # Played/upcoming partitions built once per fetch; switching the
+        # filter dropdown is then a dict lookup, not a rescan
+        self._filter_buckets: dict = {"all": [], "played": [], "upcoming": []}
+        self._bucket_rows: dict = {"all": [], "played": [], "upcoming": []}
+        self._match_by_key = {}  # DataTable row key -> _MatchRow
         self.show_upcoming = True  # Show upcoming games by default
+        self._filter_timer = None  # Debounce handle for filter changes
+        self._last_render_key = None  # Fingerprint of the last render
         self.last_fetch_time = 0  # Store last fetch duration
 
-    def load_categories(self) -> dict:
-        """Load categories from JSON file"""
-        categories_path = Path(__file__).parent.parent.parent / "categories.json"
-        if categories_path.exists():
-            with open(categories_path) as f:
-                return cast(dict, json.load(f))
-        return {
-            "2": {"category_name": "Miesten I divisioona A"},
-            "4": {"category_name": "Korisliiga"},
-        }
-
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
         yield Header()
 
         with Container(id="controls"):
             with Horizontal():
-                # Create category options for Select widget
-                category_options = [
-                    (f"{cat_id}: {cat_data['category_name']}", cat_id)
-                    for cat_id, cat_data in self.categories.items()
-                ]
                 yield Select(
-                    options=category_options,
+                    options=self._category_options,
                     value=self.current_category,
                     id="category_select",
                     prompt="Select Category",
@@ -1091,51 +1303,63 @@ class KorisApp(App):
 
     def on_mount(self) -> None:
         """Set up the table when the app starts"""
-        table = self.query_one(DataTable)
-        table.cursor_type = "cell"
+        # Resolve widget handles once; query_one walks the DOM on every call
+        self._status = self.query_one("#status", Static)
+        self._table = self.query_one(DataTable)
+        self._season_select = self.query_one("#season_select", Select)
+        self._filter_select = self.query_one("#filter_select", Select)
+        self._table.cursor_type = "cell"
         # Auto-load seasons for the default category
         self.load_seasons()
         # Auto-fetch matches for the default season (will be set after seasons load)
+        # Warm the seasons cache for the other categories in the background
+        # so switching category later costs no round trip
+        self.prefetch_categories()
+
+    @staticmethod
+    def _sel(event: Select.Changed) -> Optional[str]:
+        """Canonicalized value of a Select event, or None when blank."""
+        value = event.value
+        if value == Select.BLANK or not value:
+            return None
+        return str(value)
 
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle category selection changes"""
-        if event.select.id == "category_select":
-            # Ignore blank selections
-            if event.value == Select.BLANK or not event.value:
-                return
-
-            self.current_category = str(event.value)
-            status = self.query_one("#status", Static)
-            category_name = self.categories[self.current_category]["category_name"]
-            status.update(f"Selected: {category_name} - Loading seasons...")
-            # Auto-load seasons when category changes
-            self.load_seasons()
-        elif event.select.id == "season_select":
-            # Ignore blank selections
-            if event.value == Select.BLANK or not event.value:
-                return
+        # One blank guard and one str() for all four selects
+        value = self._sel(event)
+        if value is None:
+            return
 
-            if str(event.value) and str(event.value) in self.seasons:
-                season_data = self.seasons[str(event.value)]
-                self.current_season = str(event.value)
-                self.current_competition_id = season_data["competition_id"]
-                status = self.query_one("#status", Static)
-                status.update(
-                    f"Selected season: {season_data['season_name']} - Loading matches..."
+        match event.select.id:
+            case "category_select":
+                self.current_category = value
+                category_name = self.categories[value]["category_name"]
+                self._status.update(
+                    f"Selected: {category_name} - Loading seasons..."
                 )
-                # Auto-fetch matches when season changes
-                self.fetch_matches()
-        elif event.select.id == "format_select":
-            # Ignore blank selections
-            if event.value == Select.BLANK or not event.value:
-                return
-            self.save_format = str(event.value)
-        elif event.select.id == "filter_select":
-            # Ignore blank selections
-            if event.value == Select.BLANK or not event.value:
-                return
-            # Re-render matches with new filter
-            self.render_matches()
+                # Auto-load seasons when category changes
+                self.load_seasons()
+            case "season_select":
+                if value in self.seasons:
+                    season_data = self.seasons[value]
+                    self.current_season = value
+                    self.current_competition_id = season_data["competition_id"]
+                    self._status.update(
+                        f"Selected season: {season_data['season_name']} - Loading matches..."
+                    )
+                    # Auto-fetch matches when season changes
+                    self.fetch_matches()
+            case "format_select":
+                self.save_format = value
+            case "filter_select":
+                # Coalesce rapid toggles: restart the timer on each change
+                # so only the filter the user settles on triggers a render,
+                # which reads the live Select value and is therefore
+                # latest-wins
+                if self._filter_timer is not None:
+                    self._filter_timer.stop()
+                self._filter_timer = self.set_timer(0.05, self.render_matches)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses"""
@@ -1144,36 +1368,20 @@ class KorisApp(App):
 
     def on_data_table_cell_selected(self, event: DataTable.CellSelected) -> None:
         """Handle table cell selection to show team info"""
-        filter_select = self.query_one("#filter_select", Select)
-
-        # Get current filter to find the right match
-        current_filter = (
-            str(filter_select.value) if filter_select.value != Select.BLANK else "all"
-        )
-
-        # Filter matches same way as render_matches
-        filtered_matches = []
-        for match in self.matches_data:
-            if current_filter == "all":
-                filtered_matches.append(match)
-            elif current_filter == "played" and match["is_played"]:
-                filtered_matches.append(match)
-            elif current_filter == "upcoming" and not match["is_played"]:
-                filtered_matches.append(match)
-
-        # Get the row and column indices
-        row_index = event.coordinate.row
+        # render_matches indexes the displayed matches by row key, so the
+        # clicked row resolves with one dict lookup
+        match = self._match_by_key.get(event.cell_key.row_key)
         col_index = event.coordinate.column
 
-        if row_index < len(filtered_matches):
-            match = filtered_matches[row_index]
+        if match is not None:
+            data = match.data
 
             # Check which cell was clicked (column index)
             # Columns: "Home Team"(0), "Score"(1), "Away Team"(2), "Date"(3), "Time"(4)
 
             if col_index == 0:  # Home Team
-                team_id = match.get("Home Team ID")
-                team_name = match.get("Home Team")
+                team_id = data.get("Home Team ID")
+                team_name = data.get("Home Team")
                 if team_id and team_name:
                     self.push_screen(
                         TeamViewScreen(
@@ -1182,20 +1390,20 @@ class KorisApp(App):
                     )
 
             elif col_index == 1:  # Score - show match view for played matches only
-                if match["is_played"]:
-                    match_id = match.get("Match ID")
+                if match.is_played:
+                    match_id = data.get("Match ID")
                     if match_id:
                         self.push_screen(
                             MatchViewScreen(
                                 str(match_id),
-                                match.get("Home Team", ""),
-                                match.get("Away Team", ""),
+                                data.get("Home Team", ""),
+                                data.get("Away Team", ""),
                             )
                         )
 
             elif col_index == 2:  # Away Team
-                team_id = match.get("Away Team ID")
-                team_name = match.get("Away Team")
+                team_id = data.get("Away Team ID")
+                team_name = data.get("Away Team")
                 if team_id and team_name:
                     self.push_screen(
                         TeamViewScreen(
@@ -1206,73 +1414,125 @@ class KorisApp(App):
     def action_refresh(self) -> None:
         """Refresh the current view"""
         if self.current_data:
+            # An explicit refresh should always hit the network
+            invalidate_matches(
+                competition_id=self.current_competition_id,
+                category_id=self.current_category,
+            )
             self.fetch_matches()
 
+    @work(exclusive=True, thread=True, group="seasons")
     def load_seasons(self) -> None:
-        """Load available seasons for the current category"""
-        status = self.query_one("#status", Static)
-        season_select = self.query_one("#season_select", Select)
+        """Load available seasons for the current category off the UI thread."""
+        status = self._status
 
         try:
-            status.update("Loading seasons...")
-            # Use the default competition_id to get category data
-            data = BasketFiAPI.get_category("huki2526", self.current_category)
+            self.call_from_thread(status.update, "Loading seasons...")
+            # Prefetched categories resolve from memory; otherwise fetch and
+            # cache using the default competition_id
+            data = self._seasons_cache.get(self.current_category)
+            if data is None:
+                data = BasketFiAPI.get_category("huki2526", self.current_category)
+                self._seasons_cache[self.current_category] = data
 
             # Extract seasons from the response
             if "category" in data and "seasons" in data["category"]:
-                seasons_list = data["category"]["seasons"]
-                self.seasons = {}
-                season_options = []
-
-                for season in seasons_list:
-                    season_id = season["season_id"]
-                    self.seasons[season_id] = season
-                    # Only show the season name (e.g., "2025-2026")
-                    season_options.append((season["season_name"], season_id))
-
-                # Update the season select widget
-                season_select.set_options(season_options)
-                if season_options:
-                    # Set the first season as default
-                    first_season_id = seasons_list[0]["season_id"]
-                    self.current_season = first_season_id
-                    self.current_competition_id = seasons_list[0]["competition_id"]
-                    season_select.value = first_season_id
-
-                    # Auto-fetch matches for the first season
-                    status.update(
-                        f"Loaded {len(seasons_list)} seasons - Loading matches..."
-                    )
-                    self.fetch_matches()
-                else:
-                    status.update(f"Loaded {len(seasons_list)} seasons")
-                    status.add_class("info")
+                # Widget updates belong on the event loop thread
+                self.call_from_thread(
+                    self._apply_seasons, data["category"]["seasons"]
+                )
             else:
-                status.update("No seasons found")
-                status.add_class("error")
+                self.call_from_thread(status.update, "No seasons found")
+                self.call_from_thread(status.add_class, "error")
 
         except Exception as e:
-            status.update(f"Error loading seasons: {str(e)}")
-            status.add_class("error")
+            self.call_from_thread(
+                status.update, f"Error loading seasons: {str(e)}"
+            )
+            self.call_from_thread(status.add_class, "error")
+
+    @work(exclusive=False, thread=True, group="prefetch")
+    def prefetch_categories(self) -> None:
+        """Fetch season metadata for all categories concurrently.
+
+        Overlapping the round trips means the cache is warm after roughly
+        one RTT instead of one per category.
+        """
+        category_ids = [
+            cid for cid in self.categories if cid not in self._seasons_cache
+        ]
+        if not category_ids:
+            return
 
+        def fetch(category_id: str):
+            try:
+                return category_id, BasketFiAPI.get_category(
+                    "huki2526", category_id
+                )
+            except Exception:
+                # Prefetching is best-effort; load_seasons will retry on demand
+                return category_id, None
+
+        with ThreadPoolExecutor(max_workers=min(8, len(category_ids))) as executor:
+            for category_id, data in executor.map(fetch, category_ids):
+                if data is not None:
+                    self._seasons_cache.setdefault(category_id, data)
+
+    def _apply_seasons(self, seasons_list: list) -> None:
+        """Populate the season selector from a fetched seasons list."""
+        status = self._status
+        season_select = self._season_select
+
+        self.seasons = {}
+        season_options = []
+
+        for season in seasons_list:
+            season_id = season["season_id"]
+            self.seasons[season_id] = season
+            # Only show the season name (e.g., "2025-2026")
+            season_options.append((season["season_name"], season_id))
+
+        # Update the season select widget
+        season_select.set_options(season_options)
+        if season_options:
+            # Set the first season as default
+            first_season_id = seasons_list[0]["season_id"]
+            self.current_season = first_season_id
+            self.current_competition_id = seasons_list[0]["competition_id"]
+            season_select.value = first_season_id
+
+            # Auto-fetch matches for the first season
+            status.update(
+                f"Loaded {len(seasons_list)} seasons - Loading matches..."
+            )
+            self.fetch_matches()
+        else:
+            status.update(f"Loaded {len(seasons_list)} seasons")
+            status.add_class("info")
+
+    @work(exclusive=True, thread=True, group="matches")
     def fetch_matches(self) -> None:
-        """Fetch and display matches"""
-        status = self.query_one("#status", Static)
+        """Fetch and display matches off the UI thread."""
+        status = self._status
 
         if not self.current_season or not self.current_competition_id:
-            status.update("Please select a season first")
-            status.add_class("error")
+            self.call_from_thread(status.update, "Please select a season first")
+            self.call_from_thread(status.add_class, "error")
             return
 
         try:
-            status.update(f"Fetching matches for {self.current_season}...")
+            self.call_from_thread(
+                status.update, f"Fetching matches for {self.current_season}..."
+            )
 
             # Track fetch time
             import time
 
             start_time = time.time()
 
-            data = BasketFiAPI.get_matches(
+            # TTL-cached: re-selecting a recently viewed season resolves
+            # from memory instead of re-issuing the request
+            data = cached_get_matches(
                 competition_id=self.current_competition_id,
                 category_id=self.current_category,
             )
@@ -1283,103 +1543,87 @@ class KorisApp(App):
 
             # Clear matches data for saving
             self.matches_data = []
+            self._rebuild_filter_buckets()
+            self._last_render_key = None
 
             # Add matches to data - the matches are directly under the "matches" key
             if "matches" in data and len(data["matches"]) > 0:
-                matches = data["matches"]
-                for match in matches:
-                    # Team A is home, Team B is away
-                    home_team = match.get(
-                        "club_A_name", match.get("team_A_name", "N/A")
-                    )
-                    away_team = match.get(
-                        "club_B_name", match.get("team_B_name", "N/A")
-                    )
-                    date = match.get("date", "N/A")
-                    time_str = match.get("time", "N/A")
-                    if time_str and time_str != "N/A" and len(time_str) >= 5:
-                        time_str = time_str[:5]  # Show only HH:MM
-                    match_status = match.get("status", "Scheduled")
-
-                    # Get score - fs_A and fs_B are the final scores
-                    home_score = match.get("fs_A", "-")
-                    away_score = match.get("fs_B", "-")
-                    if not home_score or home_score == "":
-                        home_score = "-"
-                    if not away_score or away_score == "":
-                        away_score = "-"
-
-                    # Determine if match has been played
-                    is_played = home_score != "-" and away_score != "-"
-
-                    # Store for saving and filtering
-                    self.matches_data.append(
-                        {
-                            "Match ID": match.get("match_id", ""),
-                            "Date": date,
-                            "Time": time_str,
-                            "Home Team": home_team,
-                            "Home Team ID": match.get("team_A_id", ""),
-                            "Home Score": home_score,
-                            "Away Score": away_score,
-                            "Away Team": away_team,
-                            "Away Team ID": match.get("team_B_id", ""),
-                            "Status": match_status,
-                            "Venue": match.get("venue_name", "N/A"),
-                            "Competition": match.get("competition_name", "N/A"),
-                            "Category": match.get("category_name", "N/A"),
-                            "Season": self.current_season,
-                            "is_played": is_played,
-                        }
-                    )
+                # One comprehension over the shared normalizer instead of a
+                # long inline loop body per row
+                self.matches_data = [
+                    _normalize_match(match, self.current_season)
+                    for match in data["matches"]
+                ]
+                self._rebuild_filter_buckets()
 
                 # Render matches with current filter
-                self.render_matches()
+                self.call_from_thread(self.render_matches)
             else:
-                status.update(f"No matches found for season {self.current_season}")
-                status.remove_class("info")
-                status.add_class("error")
+                self.call_from_thread(
+                    status.update,
+                    f"No matches found for season {self.current_season}",
+                )
+                self.call_from_thread(status.remove_class, "info")
+                self.call_from_thread(status.add_class, "error")
 
         except Exception as e:
-            status.update(f"Error: {str(e)}")
-            status.remove_class("info")
-            status.add_class("error")
+            self.call_from_thread(status.update, f"Error: {str(e)}")
+            self.call_from_thread(status.remove_class, "info")
+            self.call_from_thread(status.add_class, "error")
+
+    def _rebuild_filter_buckets(self) -> None:
+        """Partition matches_data by played state in a single pass."""
+        played: list = []
+        upcoming: list = []
+        for match in self.matches_data:
+            (played if match.is_played else upcoming).append(match)
+        self._filter_buckets = {
+            "all": self.matches_data,
+            "played": played,
+            "upcoming": upcoming,
+        }
+        # Column of ready-made render tuples per bucket: the render path
+        # hands DataTable a flat list without touching the row objects
+        self._bucket_rows = {
+            name: [match.row for match in bucket]
+            for name, bucket in self._filter_buckets.items()
+        }
 
     def render_matches(self) -> None:
         """Render matches based on current filter"""
-        status = self.query_one("#status", Static)
-        table = self.query_one(DataTable)
-        filter_select = self.query_one("#filter_select", Select)
-
-        # Clear and set up table
-        table.clear(columns=True)
-        table.add_columns("Home Team", "Score", "Away Team", "Date", "Time")
+        status = self._status
+        table = self._table
+        filter_select = self._filter_select
 
         # Get current filter
         current_filter = (
             str(filter_select.value) if filter_select.value != Select.BLANK else "all"
         )
 
-        # Filter matches
-        filtered_matches = []
-        for match in self.matches_data:
-            if current_filter == "all":
-                filtered_matches.append(match)
-            elif current_filter == "played" and match["is_played"]:
-                filtered_matches.append(match)
-            elif current_filter == "upcoming" and not match["is_played"]:
-                filtered_matches.append(match)
-
-        # Add to table
-        for match in filtered_matches:
-            score = f"{match['Home Score']} - {match['Away Score']}"
-            table.add_row(
-                match["Home Team"],
-                score,
-                match["Away Team"],
-                match["Date"],
-                match["Time"],
-            )
+        # A spurious event with the same filter over the same data would
+        # rebuild an identical table; skip it outright
+        render_key = (current_filter, id(self.matches_data), len(self.matches_data))
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
+
+        # Look up the precomputed partition for this filter
+        filtered_matches = self._filter_buckets.get(current_filter, self.matches_data)
+
+        # Remember what the table shows so click handling and saving can
+        # reuse it without re-filtering
+        self.displayed_matches = filtered_matches
+
+        # Rebuild the table inside one batched update: a single add_rows
+        # call lays the columns out once instead of once per row, and
+        # batch_update holds the repaint until the table is complete
+        with self.batch_update():
+            table.clear(columns=True)
+            table.add_columns("Home Team", "Score", "Away Team", "Date", "Time")
+            row_keys = table.add_rows(self._bucket_rows.get(current_filter, []))
+            # Index the displayed matches by their table row key so clicks
+            # resolve in O(1) even if rows are ever reordered
+            self._match_by_key = dict(zip(row_keys, filtered_matches))
 
         # Update status with count and time
         total_matches = len(self.matches_data)
@@ -1400,8 +1644,7 @@ class KorisApp(App):
 
     def save_data(self) -> None:
         """Save the current matches data to a file"""
-        status = self.query_one("#status", Static)
-        filter_select = self.query_one("#filter_select", Select)
+        status = self._status
 
         if not self.matches_data:
             status.update("No data to save. Fetch matches first.")
@@ -1411,23 +1654,16 @@ class KorisApp(App):
         try:
             # Get current filter
             current_filter = (
-                str(filter_select.value)
-                if filter_select.value != Select.BLANK
+                str(self._filter_select.value)
+                if self._filter_select.value != Select.BLANK
                 else "all"
             )
 
-            # Filter matches for saving
-            filtered_matches = []
-            for match in self.matches_data:
-                # Remove the is_played field before saving
-                match_copy = {k: v for k, v in match.items() if k != "is_played"}
-
-                if current_filter == "all":
-                    filtered_matches.append(match_copy)
-                elif current_filter == "played" and match["is_played"]:
-                    filtered_matches.append(match_copy)
-                elif current_filter == "upcoming" and not match["is_played"]:
-                    filtered_matches.append(match_copy)
+            # displayed_matches already reflects the current filter, and
+            # each row keeps its exportable dict free of internal fields,
+            # so the writers can use the dicts directly - no per-row copy
+            displayed = self.displayed_matches
+            row_count = len(displayed)
 
             # Generate filename
             category_name = self.categories.get(self.current_category, {}).get(
@@ -1444,20 +1680,41 @@ class KorisApp(App):
             if self.save_format == "json":
                 filename = f"matches_{category_name}_{season}{filter_suffix}.json"
                 with open(filename, "w", encoding="utf-8") as f:
-                    json.dump(filtered_matches, f, indent=2, ensure_ascii=False)
-                status.update(f"Saved {len(filtered_matches)} matches to {filename}")
+                    json.dump(
+                        [match.data for match in displayed],
+                        f,
+                        indent=2,
+                        ensure_ascii=False,
+                    )
+                status.update(f"Saved {row_count} matches to {filename}")
 
             elif self.save_format == "csv":
                 filename = f"matches_{category_name}_{season}{filter_suffix}.csv"
-                df = pd.DataFrame(filtered_matches)
-                df.to_csv(filename, index=False, encoding="utf-8")
-                status.update(f"Saved {len(filtered_matches)} matches to {filename}")
+                # csv.DictWriter pulls the row dicts lazily, as-is
+                with open(filename, "w", newline="", encoding="utf-8") as f:
+                    if displayed:
+                        writer = csv.DictWriter(
+                            f, fieldnames=list(displayed[0].data.keys())
+                        )
+                        writer.writeheader()
+                        writer.writerows(match.data for match in displayed)
+                status.update(f"Saved {row_count} matches to {filename}")
 
             elif self.save_format == "excel":
                 filename = f"matches_{category_name}_{season}{filter_suffix}.xlsx"
-                df = pd.DataFrame(filtered_matches)
-                df.to_excel(filename, index=False, engine="openpyxl")
-                status.update(f"Saved {len(filtered_matches)} matches to {filename}")
+                from openpyxl import Workbook  # type: ignore[import-untyped]
+
+                # write_only workbooks append rows without keeping the whole
+                # sheet in memory
+                workbook = Workbook(write_only=True)
+                sheet = workbook.create_sheet()
+                if displayed:
+                    headers = list(displayed[0].data.keys())
+                    sheet.append(headers)
+                    for match in displayed:
+                        sheet.append([match.data[key] for key in headers])
+                workbook.save(filename)
+                status.update(f"Saved {row_count} matches to {filename}")
 
             status.remove_class("error")
             status.add_class("info")
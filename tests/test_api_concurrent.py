@@ -0,0 +1,166 @@
+"""Integration tests for the concurrent match download pipeline (requires internet)."""
+
+import contextlib
+import itertools
+import json
+import os
+import sys
+import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from koris_api import download_matches_with_boxscores
+
+# Mark all tests in this module as integration tests
+pytestmark = pytest.mark.integration
+
+# Interned status literals so the hot comparison loops hit the pointer
+# fast path before falling back to character comparison
+_PLAYED = sys.intern("Played")
+_FIXTURE = sys.intern("Fixture")
+
+
+@contextlib.contextmanager
+def _tmp_json_path():
+    """Yield a temp .json path with the descriptor closed, unlinking on exit."""
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        yield path
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+# =============================================================================
+# DOWNLOAD TESTS - Exercise download_matches_with_boxscores against live API
+# =============================================================================
+
+
+@pytest.fixture(scope="session")
+def concurrent_dump(tmp_path_factory):
+    """Run one advanced download per session and share the result across tests."""
+    output_file = tmp_path_factory.mktemp("concurrent") / "dump.json"
+    data = download_matches_with_boxscores(
+        season_id="huki2526",
+        category_id="4",
+        output_file=str(output_file),
+        include_advanced=True,
+        max_workers=3,
+        verbose=False,
+    )
+    assert data is not None, "Download should return the saved data"
+    return data
+
+
+def test_download_only_fetches_played_matches(concurrent_dump):
+    """Test that the download saves played matches only."""
+    matches = concurrent_dump["matches"]
+    assert len(matches) > 0, "Should have downloaded matches"
+
+    # Bucket the statuses in one C-speed pass; the offender list in the
+    # failure message is only built when the assertion actually fails
+    status_counts = Counter(m.get("status") for m in matches)
+    assert status_counts[_PLAYED] == len(matches), (
+        "Non-played matches in output: "
+        f"{[m['match_id'] for m in matches if m.get('status') != _PLAYED]}"
+    )
+    assert status_counts[_FIXTURE] == 0, "Fixtures should be filtered out"
+
+    metadata = concurrent_dump["metadata"]
+    assert metadata["played_matches_saved"] == len(matches)
+    assert metadata["total_matches_in_season"] >= len(matches)
+
+
+def test_concurrent_download_with_advanced(concurrent_dump):
+    """Test downloading matches with advanced box scores fetched concurrently."""
+    data = concurrent_dump
+    matches = data["matches"]
+    assert len(matches) > 0, "Should have downloaded matches"
+
+    matches_with_advanced = [m for m in matches if "advanced_boxscore" in m]
+    assert len(matches_with_advanced) > 0, (
+        "Should have fetched advanced box scores for some matches"
+    )
+
+    # Advanced box scores should only be attached to played matches
+    for match in matches_with_advanced:
+        assert match.get("status") == _PLAYED, (
+            "Advanced box score attached to a non-played match"
+        )
+
+    # Spot-check the boxscore structure on a few matches
+    for match in itertools.islice(matches_with_advanced, 5):
+        boxscore = match["advanced_boxscore"]
+        assert "match_info" in boxscore
+        assert "teams" in boxscore
+        assert len(boxscore["teams"]) == 2
+
+    metadata = data["metadata"]
+    assert metadata["include_advanced_stats"] is True
+    assert metadata["matches_with_advanced_stats"] == len(matches_with_advanced)
+
+
+def test_concurrent_download_without_advanced():
+    """Test that advanced box scores are skipped when not requested."""
+    with _tmp_json_path() as output_file:
+        data = download_matches_with_boxscores(
+            season_id="huki2526",
+            category_id="4",
+            output_file=output_file,
+            include_advanced=False,
+            verbose=False,
+        )
+
+        assert data is not None, "Download should return the saved data"
+        assert not any("advanced_boxscore" in m for m in data["matches"]), (
+            "No advanced box scores should be fetched"
+        )
+
+        metadata = data["metadata"]
+        assert metadata["include_advanced_stats"] is False
+        assert metadata["matches_with_advanced_stats"] == 0
+
+        # Serialization round-trip: the file on disk matches the returned dict
+        with open(output_file, "r", encoding="utf-8") as f:
+            assert json.load(f) == data
+
+
+def test_concurrent_download_different_worker_counts():
+    """Test that the result is identical regardless of worker count."""
+
+    def _run(workers):
+        """Download with the given worker count and return its metadata counters."""
+        with _tmp_json_path() as output_file:
+            data = download_matches_with_boxscores(
+                season_id="huki2526",
+                category_id="4",
+                output_file=output_file,
+                include_advanced=True,
+                max_workers=workers,
+                verbose=False,
+            )
+
+        assert data is not None, "Download should return the saved data"
+        metadata = data["metadata"]
+        return {
+            "workers": workers,
+            "total": metadata["played_matches_saved"],
+            "advanced": metadata["matches_with_advanced_stats"],
+            "failed": metadata["matches_failed"],
+        }
+
+    # The three sweeps are independent and I/O-bound, so overlap them;
+    # wall time becomes max(t1, t3, t5) instead of their sum
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(_run, [1, 3, 5]))
+
+    # Every worker count should save the same matches and box scores:
+    # the (total, advanced) signature must collapse to a single value
+    sigs = {(r["total"], r["advanced"]) for r in results}
+    assert len(sigs) == 1, f"Results differ across worker counts: {results}"
+    assert max(r["failed"] for r in results) < 5, (
+        f"Too many failed box score fetches: {results}"
+    )
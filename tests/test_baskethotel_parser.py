@@ -0,0 +1,64 @@
+"""Unit tests for the BasketHotel HTML parser.
+
+These run entirely on inline HTML snippets shaped like the hosted widget
+markup; no network access is needed.
+"""
+
+from koris_api.baskethotel_parser import BasketHotelParser
+
+
+# Game-info block in the widget's real shape: every value sits inside an
+# mbt-v2-* wrapper whose class attribute contains a digit, which is exactly
+# what the raw-HTML scan must not capture.
+_GAME_INFO_WRAPPED_HTML = """
+<div class="mbt-v2-game-details">
+    <i class="fa fa-calendar"></i><span class="mbt-v2-col-6"> 12.10.2024</span>
+    <i class="fa fa-clock-o"></i><span class="mbt-v2-col-6"> 18:30</span>
+    <i class="fa fa-users"></i><span class="mbt-v2-col-12"> 987</span>
+    <div class="mbt-v2-row">Ottelunumero: <b>123456</b></div>
+</div>
+"""
+
+_GAME_INFO_PLAIN_HTML = """
+<div>
+    <i class="fa fa-calendar"></i> 12.10.2024
+    <i class="fa fa-clock-o"></i> 18:30
+    <i class="fa fa-users"></i> 987
+    Ottelunumero: 123456
+</div>
+"""
+
+
+def test_game_info_values_inside_wrappers():
+    """Values wrapped in mbt-v2-* elements parse from text, not markup."""
+    result = BasketHotelParser.parse_game_html(_GAME_INFO_WRAPPED_HTML)
+
+    # Regression: the "2" in class="mbt-v2-col-12" must not win over the
+    # real attendance in the following text node
+    assert result["game_info"] == {
+        "date": "12.10.2024",
+        "time": "18:30",
+        "attendance": 987,
+        "game_id": "123456",
+    }
+
+
+def test_game_info_values_adjacent_to_icons():
+    """Values directly after their icons parse the same way."""
+    result = BasketHotelParser.parse_game_html(_GAME_INFO_PLAIN_HTML)
+
+    assert result["game_info"] == {
+        "date": "12.10.2024",
+        "time": "18:30",
+        "attendance": 987,
+        "game_id": "123456",
+    }
+
+
+def test_extract_html_from_update_calls():
+    """MBT.API.update payloads are extracted and JS escapes undone."""
+    js = "MBT.API.update('view4', '<div class=\\\"mbt-v2-header\\\">Koe</div>');"
+    assert (
+        BasketHotelParser.extract_html_from_response(js)
+        == '<div class="mbt-v2-header">Koe</div>'
+    )
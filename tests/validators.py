@@ -0,0 +1,64 @@
+"""One-pass structural validators for the live payload tests.
+
+Kept as plain, fully annotated functions over concrete dict/frozenset types
+so the module compiles cleanly under mypyc or Cython should the suite ever
+want the validators in native code; nothing here depends on pytest.
+"""
+
+from typing import Any, Dict, FrozenSet
+
+_TEAM_SECTION_FIELDS: FrozenSet[str] = frozenset(
+    {"team_name", "players", "totals", "coaches"}
+)
+_REQUIRED_PLAYER_STATS: FrozenSet[str] = frozenset(
+    {"Player", "Points", "Total Rebounds", "Assists"}
+)
+_CATEGORY_FIELDS: FrozenSet[str] = frozenset(
+    {"category_id", "category_name", "seasons"}
+)
+_SEASON_FIELDS: FrozenSet[str] = frozenset(
+    {"season_id", "season_name", "competition_id"}
+)
+
+
+def validate_boxscore(boxscore: Dict[str, Any]) -> None:
+    """Validate the structure of a parsed boxscore payload."""
+    assert "teams" in boxscore
+    assert len(boxscore["teams"]) == 2
+
+    for team in boxscore["teams"]:
+        missing = _TEAM_SECTION_FIELDS - team.keys()
+        assert not missing, f"Team is missing fields: {missing}"
+
+        if team["players"]:
+            missing = _REQUIRED_PLAYER_STATS - team["players"][0].keys()
+            assert not missing, f"Player is missing stats: {missing}"
+
+
+def validate_team(team_data: Dict[str, Any]) -> None:
+    """Validate the structure of a team payload including its roster."""
+    team = team_data["team"]
+
+    assert "players" in team
+    assert len(team["players"]) > 0
+
+    player = team["players"][0]
+    assert "player_id" in player
+    assert "first_name" in player or "last_name" in player
+
+    # Check officials (coaching staff)
+    if "officials" in team:
+        assert len(team["officials"]) > 0
+
+
+def validate_category(category_data: Dict[str, Any]) -> None:
+    """Validate the structure of a category payload including its seasons."""
+    assert "category" in category_data
+    category = category_data["category"]
+
+    missing = _CATEGORY_FIELDS - category.keys()
+    assert not missing, f"Category is missing fields: {missing}"
+    assert len(category["seasons"]) > 0
+
+    missing = _SEASON_FIELDS - category["seasons"][0].keys()
+    assert not missing, f"Season is missing fields: {missing}"